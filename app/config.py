@@ -19,6 +19,8 @@ class Settings(BaseSettings):
     confluence_password: str
     confluence_space_key: str
     confluence_parent_page_id: str
+    confluence_fetch_workers: int = 4  # 페이지 본문 동시 요청 수
+    confluence_parse_workers: int = 0  # HTML 파싱 프로세스 수 (0이면 요청 처리 프로세스에서 파싱)
     
     # LLM API
     llm_api_base_url: str
@@ -27,6 +29,19 @@ class Settings(BaseSettings):
     llm_model_name: str = "gpt-oss"
     llm_system_name: str = "AI_Evaluation_System"
     llm_user_id: str = "system_user"
+    llm_max_concurrency: int = 4  # 일괄 평가 시 동시 LLM 호출 수
+    llm_requests_per_minute: int = 20  # LLM 호출 수 제한 (RPM)
+    llm_tokens_per_minute: int = 100000  # LLM 토큰 수 제한 (TPM, 추정치 기준)
+    llm_json_mode: bool = False  # response_format=json_object 사용 (지원하는 서버만)
+    llm_cache_enabled: bool = False  # 동일 프롬프트 응답 디스크 캐시 사용
+    llm_cache_dir: str = "./data/llm_cache"
+    llm_cache_memory_size: int = 256  # 디스크 캐시 앞단 메모리 LRU 항목 수 (0: 사용 안 함)
+    llm_cache_ttl: int = 0  # 캐시 유효 시간 (초, 0: 만료 없음)
+    llm_streaming: bool = False  # 응답 스트리밍 (JSON 객체가 완성되면 나머지 생성 중단)
+    llm_batch_prompt_size: int = 1  # 요청 1회에 담을 지원서 수 (1: 배치 프롬프트 사용 안 함)
+    llm_commit_every: int = 25  # 일괄 평가 중 커밋 주기 (지원서 수, 0: 마지막에 한 번)
+    llm_prompt_cache_control: bool = False  # system 메시지에 cache_control 표시 (Anthropic 호환 게이트웨이용)
+    llm_http2: bool = False  # LLM API 연결에 HTTP/2 사용 (h2 패키지 필요, 지원하는 서버만)
     
     # Authentication
     secret_key: str
@@ -35,6 +50,9 @@ class Settings(BaseSettings):
     
     # Database
     database_url: str = "sqlite:///./data/app.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 1800  # seconds
     
     class Config:
         env_file = ".env"
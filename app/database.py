@@ -1,21 +1,44 @@
 """
 Database configuration and session management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.config import settings
 
+database_url = make_url(settings.database_url)
+engine_options = {}
+if database_url.get_backend_name() != "sqlite":
+    # 장시간 동기화 중 끊긴 연결을 재사용하지 않도록 풀 크기/재활용 설정
+    engine_options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+    )
+if database_url.get_backend_name() == "postgresql" and database_url.get_driver_name() == "psycopg2":
+    # 동기화 시 대량 INSERT/UPDATE를 multi-VALUES / execute_batch로 전송
+    engine_options.update(
+        executemany_mode="values_plus_batch",
+        insertmanyvalues_page_size=1000,
+        executemany_batch_page_size=500,
+    )
+
 # Create SQLAlchemy engine
 engine = create_engine(
-    settings.database_url,
+    database_url,
     connect_args={"check_same_thread": False} if "sqlite" in settings.database_url else {},
     echo=settings.debug,
+    pool_pre_ping=True,
+    **engine_options,
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Session for bulk ingest (Confluence sync): 배치마다 커밋해도 객체를 만료시키지 않음
+BulkSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
 # Create Base class for models
 Base = declarative_base()
 
@@ -33,9 +56,59 @@ def get_db():
         db.close()
 
 
+def get_bulk_db():
+    """
+    Dependency function to get a bulk ingest session
+    Yields:
+        Session: Database session with expire_on_commit disabled
+    """
+    db = BulkSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+# 기존 테이블에 나중에 추가된 nullable 컬럼 (create_all은 기존 테이블을 변경하지 않음)
+ADDED_COLUMNS = {
+    "applications": ("content_hash",),
+}
+
+
 def init_db():
     """
     Initialize database tables
     """
     from app.models import user, department, application, evaluation, category
     Base.metadata.create_all(bind=engine)
+    add_missing_columns(engine)
+
+
+def add_missing_columns(bind):
+    """
+    Add columns from ADDED_COLUMNS that an existing database does not have yet
+    
+    Args:
+        bind: Engine to inspect and alter
+        
+    Returns:
+        List of added "table.column" names
+    """
+    inspector = inspect(bind)
+    preparer = bind.dialect.identifier_preparer
+    added = []
+    with bind.begin() as conn:
+        for table_name, column_names in ADDED_COLUMNS.items():
+            if not inspector.has_table(table_name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table_name)}
+            for column_name in column_names:
+                if column_name in existing:
+                    continue
+                column = Base.metadata.tables[table_name].c[column_name]
+                conn.execute(text(
+                    f"ALTER TABLE {preparer.quote(table_name)} "
+                    f"ADD COLUMN {preparer.quote(column_name)} {column.type.compile(dialect=bind.dialect)}"
+                ))
+                added.append(f"{table_name}.{column_name}")
+    return added
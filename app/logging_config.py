@@ -0,0 +1,47 @@
+"""
+Logging configuration
+"""
+import logging
+import logging.handlers
+import queue
+import sys
+from typing import Optional
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def setup_logging(debug: bool = False):
+    """
+    Configure the "app" logger hierarchy
+    
+    Records are put on an in-memory queue and written to stdout by a
+    background QueueListener thread, so request/sync loops never block
+    on console I/O.
+    
+    Args:
+        debug: Enable DEBUG level (per-item progress messages)
+    """
+    global _listener
+    if _listener is not None:
+        return
+    
+    log_queue = queue.Queue(-1)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+    )
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler)
+    _listener.start()
+    
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(logging.DEBUG if debug else logging.INFO)
+    app_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    app_logger.propagate = False
+
+
+def shutdown_logging():
+    """Flush queued records and stop the background listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
@@ -7,9 +7,13 @@ from fastapi.templating import Jinja2Templates
 from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import settings
+from app.logging_config import setup_logging, shutdown_logging
 from app.database import init_db
 from app.routers import auth, users, departments, categories, applications, evaluations, statistics, pages
 
+# Configure logging (background queue listener)
+setup_logging(debug=settings.debug)
+
 # Initialize database
 init_db()
 
@@ -70,6 +74,15 @@ async def startup_event():
         db.close()
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Shutdown event"""
+    from app.services.llm_evaluator import llm_evaluator
+    
+    await llm_evaluator.aclose()
+    shutdown_logging()
+
+
 @app.get("/", response_class=HTMLResponse)
 async def root(request: Request):
     """Root endpoint - redirect to dashboard"""
@@ -59,6 +59,7 @@ class Application(Base):
     batch_id = Column(String(50), index=True)  # 회차 (예: "2026-1Q")
     status = Column(String(20), default="pending")  # pending, ai_evaluated, user_evaluated
     parse_error_log = Column(Text)
+    content_hash = Column(String(32))  # Confluence 본문 blake2b 해시 (변경 감지용)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
@@ -8,7 +8,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import or_
 import csv
 import io
-from app.database import get_db
+from app.database import get_db, get_bulk_db
 from app.schemas.application import (
     ApplicationResponse, ApplicationUpdate, ApplicationFilter, UserEvaluationSubmit, ConfluenceSyncRequest
 )
@@ -282,11 +282,13 @@ async def get_application_evaluations(
     return {"message": "Evaluation submitted successfully"}
 
 
+# 동기화는 HTTP 조회, 스레드/프로세스 풀, DB 쓰기로 오래 블로킹되므로 def로 선언하여
+# FastAPI 스레드풀에서 실행 (이벤트 루프에서 돌면 동기화 동안 다른 요청이 모두 멈춤)
 @router.post("/sync")
-async def sync_confluence_data(
+def sync_confluence_data(
     sync_request: ConfluenceSyncRequest,
     current_user: User = Depends(get_current_active_admin),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_bulk_db)
 ):
     """
     Sync applications from Confluence (admin only)
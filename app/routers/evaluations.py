@@ -3,7 +3,7 @@ Evaluations router
 """
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from app.database import get_db
 from app.schemas.evaluation import (
     AIEvaluationRequest, AIEvaluationResponse,
@@ -40,42 +40,47 @@ async def run_ai_evaluation(
         else:
             query = db.query(Application).filter(Application.ai_grade.is_(None))
     
-    applications = query.all()
+    # 프롬프트의 조직 정보에 쓰이는 부서를 함께 로드 (지원서별 추가 조회 방지)
+    applications = query.options(joinedload(Application.department)).all()
     
     # Get evaluation criteria
-    criteria_list = db.query(EvaluationCriteria).filter(
-        EvaluationCriteria.is_active == True
-    ).order_by(EvaluationCriteria.display_order).all()
+    criteria_list = llm_evaluator.get_active_criteria(db)
     
     # Get AI categories
     from app.models.category import AICategory
     categories = db.query(AICategory).filter(AICategory.is_active == True).all()
     
-    # Evaluate each application
+    # Classify AI technology (keyword matching, no I/O)
+    # 지원서마다 커밋하지 않고 평가 결과와 함께 커밋 (커밋마다 전체 객체가 만료되어 재조회되는 것도 방지)
+    results = {}
+    to_evaluate = []
+    for app in applications:
+        try:
+            ai_classifier.classify_and_update(db, app, categories, commit=False)
+            to_evaluate.append(app)
+        except Exception as e:
+            results[app.id] = (False, str(e))
+    
+    # Evaluate with LLM (동시 호출 수는 settings.llm_max_concurrency로 제한)
+    # 지원서별 오류는 (성공 여부, 오류 메시지)로 받고, 커밋 실패도 해당 지원서의 실패로 보고됨
+    results.update(await llm_evaluator.aevaluate_applications(db, to_evaluate, criteria_list))
+    
     success_count = 0
     fail_count = 0
     failed_ids = []
     error_messages = []
     
     for app in applications:
-        try:
-            # Classify AI technology
-            ai_classifier.classify_and_update(db, app, categories)
-            
-            # Evaluate with LLM
-            success = llm_evaluator.evaluate_application(db, app, criteria_list)
-            
-            if success:
-                success_count += 1
-            else:
-                fail_count += 1
-                failed_ids.append(app.id)
-                error_messages.append(f"Failed to evaluate application {app.id}")
-                
-        except Exception as e:
+        success, error = results[app.id]
+        if success:
+            success_count += 1
+        else:
             fail_count += 1
             failed_ids.append(app.id)
-            error_messages.append(f"Error evaluating application {app.id}: {str(e)}")
+            if error:
+                error_messages.append(f"Error evaluating application {app.id}: {error}")
+            else:
+                error_messages.append(f"Failed to evaluate application {app.id}")
     
     return AIEvaluationResponse(
         success_count=success_count,
@@ -102,9 +107,7 @@ async def re_evaluate_application(
         )
     
     # Get evaluation criteria
-    criteria_list = db.query(EvaluationCriteria).filter(
-        EvaluationCriteria.is_active == True
-    ).order_by(EvaluationCriteria.display_order).all()
+    criteria_list = llm_evaluator.get_active_criteria(db)
     
     # Get AI categories
     from app.models.category import AICategory
@@ -114,8 +117,9 @@ async def re_evaluate_application(
         # Classify AI technology
         ai_classifier.classify_and_update(db, app, categories)
         
-        # Evaluate with LLM
-        success = llm_evaluator.evaluate_application(db, app, criteria_list)
+        # Evaluate with LLM (이벤트 루프를 막지 않도록 async 경로 사용)
+        # 명시적인 재평가 요청이므로 캐시된 결과 대신 새로 평가
+        success = await llm_evaluator.aevaluate_application(db, app, criteria_list, force=True)
         
         if success:
             return {"message": "Re-evaluation completed successfully"}
@@ -11,7 +11,7 @@ from app.schemas.application import (
 )
 from app.schemas.evaluation import (
     EvaluationCriteriaBase, EvaluationCriteriaCreate, EvaluationCriteriaUpdate, EvaluationCriteriaResponse,
-    EvaluationHistoryResponse, AIEvaluationRequest, AIEvaluationResponse,
+    EvaluationHistoryResponse, AIEvaluationRequest, AIEvaluationResponse, AIEvaluationResult,
     DepartmentBase, DepartmentCreate, DepartmentUpdate, DepartmentResponse,
     AICategoryBase, AICategoryCreate, AICategoryUpdate, AICategoryResponse
 )
@@ -25,7 +25,7 @@ __all__ = [
     "ApplicationFilter", "UserEvaluationSubmit", "ConfluenceSyncRequest",
     # Evaluation
     "EvaluationCriteriaBase", "EvaluationCriteriaCreate", "EvaluationCriteriaUpdate", "EvaluationCriteriaResponse",
-    "EvaluationHistoryResponse", "AIEvaluationRequest", "AIEvaluationResponse",
+    "EvaluationHistoryResponse", "AIEvaluationRequest", "AIEvaluationResponse", "AIEvaluationResult",
     # Department
     "DepartmentBase", "DepartmentCreate", "DepartmentUpdate", "DepartmentResponse",
     # AI Category
@@ -75,6 +75,14 @@ class AIEvaluationResponse(BaseModel):
     error_messages: List[str]
 
 
+class AIEvaluationResult(BaseModel):
+    """Schema for the JSON returned by the LLM (checked before it is stored)"""
+    ai_category: str = "분류"
+    business_impact: str = ""
+    technical_feasibility: str = ""
+    five_line_summary: List[str] = []
+
+
 class DepartmentBase(BaseModel):
     """Base department schema"""
     name: str = Field(..., max_length=100)
@@ -7,7 +7,9 @@ from app.services.auth import (
     get_current_active_admin, update_last_login
 )
 from app.services.rate_limiter import RateLimiter
+from app.services.grading import score_to_grade
 from app.services.confluence_parser import confluence_parser
+from app.services.llm_cache import llm_cache
 from app.services.llm_evaluator import llm_evaluator
 from app.services.ai_classifier import ai_classifier
 from app.services.statistics import statistics_service
@@ -19,7 +21,9 @@ __all__ = [
     "get_current_active_admin", "update_last_login",
     # Services
     "RateLimiter",
+    "score_to_grade",
     "confluence_parser",
+    "llm_cache",
     "llm_evaluator",
     "ai_classifier",
     "statistics_service",
@@ -1,12 +1,15 @@
 """
 AI Classifier Service
 """
-import json
+import logging
+import orjson
 from typing import List, Dict, Any
 from sqlalchemy.orm import Session
 from app.models.application import Application
 from app.models.category import AICategory
 
+logger = logging.getLogger(__name__)
+
 
 class AIClassifier:
     """AI Technology Classifier"""
@@ -57,7 +60,7 @@ class AIClassifier:
             # Parse keywords from JSON string
             if category.keywords:
                 try:
-                    keywords = json.loads(category.keywords)
+                    keywords = orjson.loads(category.keywords)
                 except:
                     keywords = []
             
@@ -96,7 +99,8 @@ class AIClassifier:
         self, 
         db: Session, 
         application: Application,
-        categories: List[AICategory] = None
+        categories: List[AICategory] = None,
+        commit: bool = True
     ) -> bool:
         """
         Classify application and update database
@@ -105,6 +109,7 @@ class AIClassifier:
             db: Database session
             application: Application to classify
             categories: List of AI categories (optional)
+            commit: Commit the result (False: leave it staged, caller commits)
             
         Returns:
             True if successful, False otherwise
@@ -115,13 +120,16 @@ class AIClassifier:
             if classification:
                 application.ai_categories = classification
                 application.ai_category_primary = classification[0]["category"]
-                db.commit()
-                print(f"✅ Classified application {application.id}: {application.ai_category_primary}")
+                if commit:
+                    db.commit()
+                logger.info("Classified application %s: %s", application.id, application.ai_category_primary)
                 return True
             else:
                 # Fallback: 키워드 매칭이 없는 경우, "데이터분석"을 기본으로 설정
-                print(f"⚠️  No categories matched for application {application.id}")
-                print(f"   ℹ️  Setting default category '데이터분석' as fallback")
+                logger.info(
+                    "No categories matched for application %s, using default category '데이터분석'",
+                    application.id
+                )
                 
                 # 기본 카테고리 설정
                 application.ai_categories = [{
@@ -132,12 +140,14 @@ class AIClassifier:
                     "note": "No keyword matches - default category assigned"
                 }]
                 application.ai_category_primary = "데이터분석"
-                db.commit()
+                if commit:
+                    db.commit()
                 return True
                 
         except Exception as e:
-            print(f"❌ Error classifying application {application.id}: {e}")
-            db.rollback()
+            logger.exception("Error classifying application %s: %s", application.id, e)
+            if commit:
+                db.rollback()
             return False
 
 
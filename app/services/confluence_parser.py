@@ -2,21 +2,204 @@
 Confluence Parser Service
 """
 import re
+import sys
 import time
+import hashlib
 import json
+import random
+import logging
+import multiprocessing
 import requests
 import urllib3
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import nullcontext
+from itertools import islice
+from dataclasses import dataclass, asdict
 from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Callable, Iterator, Optional
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
 from app.config import settings
 from app.models.application import Application
 from app.models.department import Department
 from app.services.rate_limiter import RateLimiter
 
+logger = logging.getLogger(__name__)
+
 # Disable SSL warnings when verify=False is used
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# 동기화 시 한 트랜잭션으로 저장할 페이지 수
+SYNC_BATCH_SIZE = 100
+
+# 값 종류가 적어 페이지마다 같은 문자열이 반복되는 필드 (sys.intern으로 공유)
+_INTERNED_FIELDS = ("division", "batch_id")
+
+# INSERT ... ON CONFLICT DO UPDATE를 지원하는 DB별 insert 구문
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# 하위 페이지 목록 조회 시 한 번에 받을 개수
+CHILD_PAGE_LIMIT = 500
+
+# (page_id, version)별 파싱 결과 캐시 크기
+PARSED_CACHE_SIZE = 4096
+
+# 참여인원/역량 레벨 숫자 추출
+_NUMBER_RE = re.compile(r'\d+')
+
+
+@dataclass(slots=True)
+class TechCapability:
+    """기술 역량 테이블의 한 행"""
+    category: str
+    skill: str
+    level: int
+
+
+# 헤더 셀 class → 파싱 결과 필드
+_ROW_TEXT_FIELDS = (
+    ("subject", "subject"),             # 과제명
+    ("division", "division"),           # 소속
+    ("pain", "current_work"),           # 현업업무
+    ("pain_point", "pain_point"),       # Pain Point
+    ("improve", "improvement_idea"),    # 개선아이디어
+    ("effect", "expected_effect"),      # 기대효과
+    ("hope", "hope"),                   # AI팀에 바라는 점
+)
+
+
+def _content_hash(html_content: str) -> str:
+    """페이지 본문 해시 (변경 여부 비교용)"""
+    return hashlib.blake2b(html_content.encode(), digest_size=16).hexdigest()
+
+
+def _next_row_text(soup: BeautifulSoup, class_name: str) -> Optional[str]:
+    """
+    Extract content text for a header cell
+    
+    class="subject" 등의 헤더 셀은 보통 비어있고, 다음 <tr>의 첫 <td>에 내용이 있음
+    
+    Args:
+        soup: Parsed page
+        class_name: CSS class of the header cell
+        
+    Returns:
+        Stripped text of the content cell or None
+    """
+    header_elem = soup.find(class_=class_name)
+    if header_elem is None:
+        return None
+    header_row = header_elem.find_parent('tr')
+    if header_row is None:
+        return None
+    next_row = header_row.find_next_sibling('tr')
+    if next_row is None:
+        return None
+    content_cell = next_row.find('td')
+    if content_cell is None:
+        return None
+    return content_cell.get_text(strip=True)
+
+
+def parse_application_html(html_content: str, page_id: str, page_url: str) -> Dict[str, Any]:
+    """
+    Parse application data from HTML content
+    
+    모듈 수준 함수로 두어 ProcessPoolExecutor 워커에서도 호출 가능 (pickle)
+    
+    Args:
+        html_content: XHTML content
+        page_id: Confluence page ID
+        page_url: Confluence page URL
+        
+    Returns:
+        Parsed application data dictionary
+    """
+    soup = BeautifulSoup(html_content, 'lxml')
+    data = {
+        "confluence_page_id": page_id,
+        "confluence_page_url": page_url,
+        "parse_error_log": ""
+    }
+    errors = []
+
+    try:
+        # 기본사항/신청 내용 파싱 - 헤더 행 다음 행에서 실제 내용 추출
+        for class_name, field in _ROW_TEXT_FIELDS:
+            text = _next_row_text(soup, class_name)
+            if text is not None:
+                data[field] = text
+
+        # 참여인원 (class="dept")
+        dept_text = _next_row_text(soup, "dept")
+        if dept_text is not None:
+            # 숫자만 추출
+            number = _NUMBER_RE.search(dept_text)
+            if number:
+                data["participant_count"] = int(number.group())
+
+        # 대표자 정보 - colspan 기반 파싱 (구조 분석 필요)
+        # 예: 테이블에서 "대표자" 라벨을 찾고 다음 td에서 이름, Knox ID 추출
+        rep_cells = soup.find_all('td', colspan=True)
+        for cell in rep_cells:
+            text = cell.get_text(strip=True)
+            if '대표자' in text or 'Knox' in text:
+                # 이름과 Knox ID 분리 로직
+                parts = text.split()
+                if len(parts) >= 2:
+                    data["representative_name"] = parts[0]
+                    data["representative_knox_id"] = parts[1] if len(parts) > 1 else None
+
+        # 사전 설문 파싱 - 헤더 행 다음 행에서 실제 내용 추출
+        pre_survey = {}
+        for i in range(1, 7):
+            answer = _next_row_text(soup, f"q{i}")
+            if answer is not None:
+                pre_survey[f"q{i}"] = answer
+        if pre_survey:
+            data["pre_survey"] = pre_survey
+
+        # 기술 역량 파싱 (중첩 테이블)
+        tech_capabilities = []
+        # 기술 역량 섹션 찾기
+        for table in soup.find_all('table'):
+            headers = [th.get_text(strip=True) for th in table.find_all('th')]
+            if any('기술' in h or '역량' in h for h in headers):
+                for row in table.find_all('tr')[1:]:  # 헤더 제외
+                    cells = row.find_all('td', limit=3)
+                    if len(cells) >= 3:
+                        # 셀 텍스트는 행마다 한 번만 추출
+                        category, skill, level_text = [c.get_text(strip=True) for c in cells]
+                        # 레벨 숫자 추출
+                        level_number = _NUMBER_RE.search(level_text)
+                        level = int(level_number.group()) if level_number else 0
+
+                        tech_capabilities.append(TechCapability(category, skill, level))
+        if tech_capabilities:
+            # JSON 컬럼 저장을 위해 마지막에 한 번만 dict로 변환
+            data["tech_capabilities"] = [asdict(tc) for tc in tech_capabilities]
+
+        # 기타 데이터 수집 (class 없는 데이터)
+        etc_data = {}
+        # 추가적인 파싱 로직...
+        if etc_data:
+            data["etc_data"] = etc_data
+
+    except Exception as e:
+        error_msg = f"Parsing error for page {page_id}: {str(e)}"
+        errors.append(error_msg)
+        logger.error(error_msg)
+
+    if errors:
+        data["parse_error_log"] = "\n".join(errors)
+
+    return data
+
 
 class ConfluenceParser:
     """Confluence API client and HTML parser"""
@@ -28,16 +211,101 @@ class ConfluenceParser:
         self.parent_page_id = settings.confluence_parent_page_id
         # Rate limiter: 10 calls per minute
         self.rate_limiter = RateLimiter(max_calls=10, time_window=60)
+        # 파싱 결과 LRU 캐시: (page_id, version) -> parsed data
+        self._parsed_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+    
+    def _get_cached_parse(self, page: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Get parsed data for an unchanged page version
+        
+        Args:
+            page: Page info from get_child_pages
+            
+        Returns:
+            Copy of cached parsed data or None
+        """
+        key = (page["id"], page.get("version"))
+        if key[1] is None or key not in self._parsed_cache:
+            return None
+        self._parsed_cache.move_to_end(key)
+        return dict(self._parsed_cache[key])
+    
+    def _cache_parse(self, page: Dict[str, Any], parsed_data: Dict[str, Any]):
+        """Store parsed data for the page version (LRU)"""
+        if page.get("version") is None:
+            return
+        self._parsed_cache[(page["id"], page["version"])] = dict(parsed_data)
+        if len(self._parsed_cache) > PARSED_CACHE_SIZE:
+            self._parsed_cache.popitem(last=False)
+    
+    def _retry_delay(self, response: requests.Response, attempt: int) -> float:
+        """
+        Compute wait time for a 429 response
+        
+        Retry-After 헤더를 우선 사용하고, 없으면 지수 백오프를 적용합니다.
+        동시 재시도가 같은 시각에 몰리지 않도록 최대 20%의 jitter를 더합니다.
+        
+        Args:
+            response: 429 response
+            attempt: Zero-based attempt number
+            
+        Returns:
+            Seconds to wait before retrying
+        """
+        try:
+            retry_after = float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            retry_after = min(60, 2 ** attempt)
+        return retry_after + random.uniform(0, retry_after * 0.2)
         
     def get_child_pages(self) -> List[Dict[str, str]]:
         """
         Get child pages under parent page
         
         Returns:
-            List of pages with id, title, url
+            List of pages with id, title, url, version
+        """
+        return list(self.iter_child_pages())
+    
+    def iter_child_pages(self) -> Iterator[Dict[str, str]]:
+        """
+        Iterate child pages under parent page, one REST result page at a time
+        
+        Yields:
+            Page dict with id, title, url, version
+        """
+        start = 0
+        while True:
+            data = self._get_child_page_chunk(start)
+            if data is None:
+                return
+            
+            results = data.get("results", [])
+            for page in results:
+                yield {
+                    "id": page["id"],
+                    "title": page["title"],
+                    "url": f"{self.base_url}/pages/viewpage.action?pageId={page['id']}",
+                    "version": page.get("version", {}).get("number")
+                }
+            
+            # 다음 페이지가 없으면 종료
+            if not results or "next" not in data.get("_links", {}):
+                return
+            start += len(results)
+    
+    def _get_child_page_chunk(self, start: int) -> Optional[Dict[str, Any]]:
+        """
+        Get one paginated chunk of child pages
+        
+        Args:
+            start: Offset of the first result
+            
+        Returns:
+            Raw REST response JSON or None
         """
         url = f"{self.base_url}/rest/api/content/{self.parent_page_id}/child/page"
-        params = {"limit": 500, "expand": "version"}
+        params = {"start": start, "limit": CHILD_PAGE_LIMIT, "expand": "version"}
         
         max_retries = 3
         for attempt in range(max_retries):
@@ -49,34 +317,25 @@ class ConfluenceParser:
                 
                 # Handle 429 Too Many Requests
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    print(f"⚠️  429 Too Many Requests. Waiting {retry_after} seconds... (Attempt {attempt + 1}/{max_retries})")
-                    time.sleep(retry_after)
+                    retry_after = self._retry_delay(response, attempt)
+                    logger.warning("429 Too Many Requests. Waiting %.1f seconds... (Attempt %d/%d)", retry_after, attempt + 1, max_retries)
+                    # 다음 rate_limiter.wait_if_needed()에서 대기 (동일 limiter를 쓰는 다른 호출도 함께 대기)
+                    self.rate_limiter.penalize(retry_after)
                     continue
                 
                 response.raise_for_status()
-                data = response.json()
-                
-                pages = []
-                for page in data.get("results", []):
-                    pages.append({
-                        "id": page["id"],
-                        "title": page["title"],
-                        "url": f"{self.base_url}/pages/viewpage.action?pageId={page['id']}"
-                    })
-                
-                return pages
+                return response.json()
             except requests.exceptions.HTTPError as e:
                 if attempt < max_retries - 1 and e.response.status_code == 429:
                     continue
-                print(f"❌ HTTP Error fetching child pages: {e}")
-                return []
+                logger.error("HTTP Error fetching child pages: %s", e)
+                return None
             except Exception as e:
-                print(f"❌ Error fetching child pages: {e}")
-                return []
+                logger.error("Error fetching child pages: %s", e)
+                return None
         
-        print(f"❌ Failed to fetch child pages after {max_retries} attempts")
-        return []
+        logger.error("Failed to fetch child pages after %d attempts", max_retries)
+        return None
     
     def get_page_content(self, page_id: str) -> Optional[str]:
         """
@@ -101,9 +360,10 @@ class ConfluenceParser:
                 
                 # Handle 429 Too Many Requests
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get('Retry-After', 60))
-                    print(f"⚠️  429 Too Many Requests for page {page_id}. Waiting {retry_after} seconds... (Attempt {attempt + 1}/{max_retries})")
-                    time.sleep(retry_after)
+                    retry_after = self._retry_delay(response, attempt)
+                    logger.warning("429 Too Many Requests for page %s. Waiting %.1f seconds... (Attempt %d/%d)", page_id, retry_after, attempt + 1, max_retries)
+                    # 다음 rate_limiter.wait_if_needed()에서 대기 (동일 limiter를 쓰는 다른 호출도 함께 대기)
+                    self.rate_limiter.penalize(retry_after)
                     continue
                 
                 response.raise_for_status()
@@ -112,13 +372,13 @@ class ConfluenceParser:
             except requests.exceptions.HTTPError as e:
                 if attempt < max_retries - 1 and e.response.status_code == 429:
                     continue
-                print(f"❌ HTTP Error fetching page {page_id}: {e}")
+                logger.error("HTTP Error fetching page %s: %s", page_id, e)
                 return None
             except Exception as e:
-                print(f"❌ Error fetching page {page_id}: {e}")
+                logger.error("Error fetching page %s: %s", page_id, e)
                 return None
         
-        print(f"❌ Failed to fetch page {page_id} after {max_retries} attempts")
+        logger.error("Failed to fetch page %s after %d attempts", page_id, max_retries)
         return None
     
     def parse_application(self, html_content: str, page_id: str, page_url: str) -> Dict[str, Any]:
@@ -133,180 +393,188 @@ class ConfluenceParser:
         Returns:
             Parsed application data dictionary
         """
-        soup = BeautifulSoup(html_content, 'lxml')
-        data = {
-            "confluence_page_id": page_id,
-            "confluence_page_url": page_url,
-            "parse_error_log": ""
-        }
-        errors = []
+        return parse_application_html(html_content, page_id, page_url)
+    
+    @staticmethod
+    def _is_unchanged(stored: Optional[tuple], content_hash: Optional[str], batch_id: Optional[str]) -> bool:
+        """
+        Check whether a stored application already matches the fetched content
         
-        try:
-            # 기본사항 파싱 - 헤더 행 다음 행에서 실제 내용 추출
-            # class="subject" 등의 헤더 셀은 보통 비어있고, 다음 <tr>의 <td>에 내용이 있음
-            
-            # 과제명 (class="subject")
-            subject_elem = soup.find(class_="subject")
-            if subject_elem:
-                header_row = subject_elem.find_parent('tr')
-                if header_row:
-                    next_row = header_row.find_next_sibling('tr')
-                    if next_row:
-                        content_cell = next_row.find('td')
-                        if content_cell:
-                            data["subject"] = content_cell.get_text(strip=True)
-            
-            # 소속 (class="division")
-            division_elem = soup.find(class_="division")
-            if division_elem:
-                header_row = division_elem.find_parent('tr')
-                if header_row:
-                    next_row = header_row.find_next_sibling('tr')
-                    if next_row:
-                        content_cell = next_row.find('td')
-                        if content_cell:
-                            data["division"] = content_cell.get_text(strip=True)
-            
-            # 참여인원 (class="dept")
-            dept_elem = soup.find(class_="dept")
-            if dept_elem:
-                header_row = dept_elem.find_parent('tr')
-                if header_row:
-                    next_row = header_row.find_next_sibling('tr')
-                    if next_row:
-                        content_cell = next_row.find('td')
-                        if content_cell:
-                            dept_text = content_cell.get_text(strip=True)
-                            # 숫자만 추출
-                            numbers = re.findall(r'\d+', dept_text)
-                            if numbers:
-                                data["participant_count"] = int(numbers[0])
-            
-            # 대표자 정보 - colspan 기반 파싱 (구조 분석 필요)
-            # 예: 테이블에서 "대표자" 라벨을 찾고 다음 td에서 이름, Knox ID 추출
-            rep_cells = soup.find_all('td', colspan=True)
-            for cell in rep_cells:
-                text = cell.get_text(strip=True)
-                if '대표자' in text or 'Knox' in text:
-                    # 이름과 Knox ID 분리 로직
-                    parts = text.split()
-                    if len(parts) >= 2:
-                        data["representative_name"] = parts[0]
-                        data["representative_knox_id"] = parts[1] if len(parts) > 1 else None
-            
-            # 사전 설문 파싱 - 헤더 행 다음 행에서 실제 내용 추출
-            pre_survey = {}
-            for i in range(1, 7):
-                q_elem = soup.find(class_=f"q{i}")
-                if q_elem:
-                    header_row = q_elem.find_parent('tr')
-                    if header_row:
-                        next_row = header_row.find_next_sibling('tr')
-                        if next_row:
-                            content_cell = next_row.find('td')
-                            if content_cell:
-                                pre_survey[f"q{i}"] = content_cell.get_text(strip=True)
-            if pre_survey:
-                data["pre_survey"] = pre_survey
-            
-            # 신청 내용 파싱 - 헤더 행 다음 행에서 실제 내용 추출
-            # class="pain" 등의 헤더 셀은 보통 비어있고, 다음 <tr>의 <td>에 내용이 있음
-            
-            # 현업업무 (class="pain")
-            pain_elem = soup.find(class_="pain")
-            if pain_elem:
-                # 헤더 행(<tr>)의 다음 형제 행에서 내용 추출
-                header_row = pain_elem.find_parent('tr')
-                if header_row:
-                    next_row = header_row.find_next_sibling('tr')
-                    if next_row:
-                        content_cell = next_row.find('td')
-                        if content_cell:
-                            data["current_work"] = content_cell.get_text(strip=True)
-            
-            # Pain Point (class="pain_point" 또는 별도 섹션)
-            pain_point_elem = soup.find(class_="pain_point")
-            if pain_point_elem:
-                header_row = pain_point_elem.find_parent('tr')
-                if header_row:
-                    next_row = header_row.find_next_sibling('tr')
-                    if next_row:
-                        content_cell = next_row.find('td')
-                        if content_cell:
-                            data["pain_point"] = content_cell.get_text(strip=True)
-            
-            # 개선아이디어 (class="improve")
-            improve_elem = soup.find(class_="improve")
-            if improve_elem:
-                header_row = improve_elem.find_parent('tr')
-                if header_row:
-                    next_row = header_row.find_next_sibling('tr')
-                    if next_row:
-                        content_cell = next_row.find('td')
-                        if content_cell:
-                            data["improvement_idea"] = content_cell.get_text(strip=True)
-            
-            # 기대효과 (class="effect")
-            effect_elem = soup.find(class_="effect")
-            if effect_elem:
-                header_row = effect_elem.find_parent('tr')
-                if header_row:
-                    next_row = header_row.find_next_sibling('tr')
-                    if next_row:
-                        content_cell = next_row.find('td')
-                        if content_cell:
-                            data["expected_effect"] = content_cell.get_text(strip=True)
-            
-            # AI팀에 바라는 점 (class="hope")
-            hope_elem = soup.find(class_="hope")
-            if hope_elem:
-                header_row = hope_elem.find_parent('tr')
-                if header_row:
-                    next_row = header_row.find_next_sibling('tr')
-                    if next_row:
-                        content_cell = next_row.find('td')
-                        if content_cell:
-                            data["hope"] = content_cell.get_text(strip=True)
+        Args:
+            stored: (content_hash, batch_id) of the stored row, or None
+            content_hash: Hash of the fetched page content
+            batch_id: Batch identifier of this sync
             
-            # 기술 역량 파싱 (중첩 테이블)
-            tech_capabilities = []
-            # 기술 역량 섹션 찾기
-            for table in soup.find_all('table'):
-                headers = [th.get_text(strip=True) for th in table.find_all('th')]
-                if any('기술' in h or '역량' in h for h in headers):
-                    for row in table.find_all('tr')[1:]:  # 헤더 제외
-                        cells = row.find_all('td')
-                        if len(cells) >= 3:
-                            category = cells[0].get_text(strip=True)
-                            skill = cells[1].get_text(strip=True)
-                            level_text = cells[2].get_text(strip=True)
-                            # 레벨 숫자 추출
-                            level_numbers = re.findall(r'\d+', level_text)
-                            level = int(level_numbers[0]) if level_numbers else 0
-                            
-                            tech_capabilities.append({
-                                "category": category,
-                                "skill": skill,
-                                "level": level
-                            })
-            if tech_capabilities:
-                data["tech_capabilities"] = tech_capabilities
+        Returns:
+            True if the UPDATE can be skipped
+        """
+        if stored is None or content_hash is None:
+            return False
+        stored_hash, stored_batch_id = stored
+        # 본문이 같아도 회차가 바뀌면 batch_id는 갱신해야 함
+        return stored_hash == content_hash and (not batch_id or stored_batch_id == batch_id)
+    
+    def _upsert_rows(self, db: Session, upsert_insert: Callable, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Insert or update parsed pages with INSERT ... ON CONFLICT DO UPDATE
+        
+        Args:
+            db: Database session
+            upsert_insert: Dialect specific insert construct (postgresql/sqlite)
+            rows: Parsed data; rows with primary key "id" are existing applications
             
-            # 기타 데이터 수집 (class 없는 데이터)
-            etc_data = {}
-            # 추가적인 파싱 로직...
-            if etc_data:
-                data["etc_data"] = etc_data
+        Returns:
+            {confluence_page_id: id} of created applications
+        """
+        new_page_ids = {row["confluence_page_id"] for row in rows if "id" not in row}
+        
+        # 파싱된 키만 갱신해야 하므로 키 구성이 같은 행끼리 한 구문으로 실행
+        groups: Dict[frozenset, List[Dict[str, Any]]] = {}
+        for row in rows:
+            values = {key: value for key, value in row.items() if key != "id"}
+            groups.setdefault(frozenset(values), []).append(values)
+        
+        created: Dict[str, int] = {}
+        for keys, values in groups.items():
+            stmt = upsert_insert(Application)
+            set_ = {key: stmt.excluded[key] for key in keys if key != "confluence_page_id"}
+            set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Application.confluence_page_id],
+                set_=set_
+            ).returning(Application.confluence_page_id, Application.id)
+            for page_id, app_id in db.execute(stmt, values):
+                if page_id in new_page_ids:
+                    created[page_id] = app_id
+        return created
+    
+    def _assign_departments(self, db: Session, page_ids: List[str]) -> None:
+        """
+        Resolve department_id from division text in a single UPDATE
+        
+        division 텍스트를 이름에 포함하는 첫 번째 부서를 매핑합니다.
+        매칭되는 부서가 없으면 기존 department_id를 유지합니다.
+        
+        Args:
+            db: Database session
+            page_ids: Confluence page IDs written in the current batch
+        """
+        matched_dept_id = (
+            select(Department.id)
+            .where(Department.name.contains(Application.division))
+            .order_by(Department.id)
+            .limit(1)
+            .scalar_subquery()
+        )
+        db.execute(
+            update(Application)
+            .where(
+                Application.confluence_page_id.in_(page_ids),
+                Application.division.isnot(None),
+                Application.division != "",
+                matched_dept_id.isnot(None),
+            )
+            .values(department_id=matched_dept_id)
+            .execution_options(synchronize_session=False)
+        )
+    
+    def _write_batch(
+        self,
+        db: Session,
+        to_insert: List[Dict[str, Any]],
+        to_update: List[Dict[str, Any]],
+        result: Dict[str, Any]
+    ) -> Dict[str, int]:
+        """
+        Save a batch of parsed pages in a single transaction
+        
+        배치 전체를 SAVEPOINT 안에서 저장하고, 실패하면 그 SAVEPOINT만 롤백한 뒤
+        행마다 SAVEPOINT를 걸어 다시 저장하여 문제가 있는 페이지만 오류로 기록합니다.
+        커밋은 배치 끝에서 한 번만 수행합니다.
+        
+        Args:
+            db: Database session
+            to_insert: Parsed data of new applications
+            to_update: Parsed data (with primary key "id") of existing applications
+            result: Sync result statistics to update
             
-        except Exception as e:
-            error_msg = f"Parsing error for page {page_id}: {str(e)}"
-            errors.append(error_msg)
-            print(f"❌ {error_msg}")
+        Returns:
+            {confluence_page_id: id} of created applications
+        """
+        try:
+            with db.begin_nested():
+                created = self._write_rows(db, to_insert, to_update)
+            updated = to_update
+        except Exception:
+            created = {}
+            updated = []
+            for row in to_insert + to_update:
+                is_new = "id" not in row
+                try:
+                    with db.begin_nested():
+                        if is_new:
+                            created.update(self._write_rows(db, [row], []))
+                        else:
+                            self._write_rows(db, [], [row])
+                except Exception as e:
+                    result["error_count"] += 1
+                    error_msg = f"Error processing page {row['confluence_page_id']}: {str(e)}"
+                    result["errors"].append(error_msg)
+                    logger.error(error_msg)
+                    continue
+                if not is_new:
+                    updated.append(row)
+        db.commit()
+        
+        for page_id, app_id in created.items():
+            logger.debug("Created new application: %s (id=%s)", page_id, app_id)
+        for row in updated:
+            logger.debug("Updated application: %s", row["confluence_page_id"])
+        # 같은 페이지가 중복으로 들어온 경우 upsert로 한 행만 생성됨
+        result["new_count"] += len(created)
+        result["updated_count"] += len(updated)
+        return created
+    
+    def _write_rows(
+        self,
+        db: Session,
+        to_insert: List[Dict[str, Any]],
+        to_update: List[Dict[str, Any]]
+    ) -> Dict[str, int]:
+        """
+        Execute the INSERT/UPDATE statements for parsed pages (no commit)
         
-        if errors:
-            data["parse_error_log"] = "\n".join(errors)
+        Args:
+            db: Database session
+            to_insert: Parsed data of new applications
+            to_update: Parsed data (with primary key "id") of existing applications
+            
+        Returns:
+            {confluence_page_id: id} of created applications
+        """
+        upsert_insert = _UPSERT_INSERTS.get(db.get_bind().dialect.name)
+        if upsert_insert is not None:
+            created = self._upsert_rows(db, upsert_insert, to_insert + to_update)
+            self._assign_departments(db, [row["confluence_page_id"] for row in to_insert + to_update])
+            return created
         
-        return data
+        created: Dict[str, int] = {}
+        if to_insert:
+            # ON CONFLICT를 지원하지 않는 DB는 RETURNING도 없을 수 있으므로
+            # ORM bulk INSERT(executemany) 후 생성된 id를 한 번의 SELECT로 조회
+            db.execute(insert(Application), to_insert)
+            created = dict(
+                db.execute(
+                    select(Application.confluence_page_id, Application.id)
+                    .where(Application.confluence_page_id.in_([row["confluence_page_id"] for row in to_insert]))
+                ).all()
+            )
+        if to_update:
+            # ORM bulk UPDATE by primary key (행 로드/속성 diff 없이 executemany)
+            db.execute(update(Application), to_update)
+        # department_id는 저장 후 한 번의 UPDATE로 매핑
+        self._assign_departments(db, [row["confluence_page_id"] for row in to_insert + to_update])
+        return created
     
     def sync_applications(self, db: Session, batch_id: Optional[str] = None, force_update: bool = False) -> Dict[str, Any]:
         """
@@ -324,70 +592,144 @@ class ConfluenceParser:
             "total_pages": 0,
             "new_count": 0,
             "updated_count": 0,
+            "unchanged_count": 0,
             "error_count": 0,
+            "cache_hits": 0,
             "errors": []
         }
         
-        # Get child pages
-        pages = self.get_child_pages()
-        result["total_pages"] = len(pages)
+        existing_map = {}  # {confluence_page_id: id}
+        stored_state = {}  # {confluence_page_id: (content_hash, batch_id)}
         
-        for page in pages:
-            try:
-                page_id = page["id"]
-                page_url = page["url"]
-                
-                # Check if already exists
-                existing_app = db.query(Application).filter(
-                    Application.confluence_page_id == page_id
-                ).first()
-                
-                if existing_app and not force_update:
-                    print(f"⏭️  Skipping existing page: {page_id}")
-                    continue
+        # 모든 행에 공통으로 들어가는 값
+        row_defaults = {"batch_id": batch_id} if batch_id else {}
+        
+        # 하위 페이지를 전부 받아두지 않고 SYNC_BATCH_SIZE개씩 받아 바로 처리
+        pages_iter = self.iter_child_pages()
+        
+        # HTML 파싱은 CPU 작업이라 설정 시 별도 프로세스에서 수행
+        # (멀티스레드 서버에서 fork하지 않도록 spawn 사용)
+        if settings.confluence_parse_workers > 0:
+            parse_pool_context = ProcessPoolExecutor(
+                max_workers=settings.confluence_parse_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            parse_pool_context = nullcontext()
+        
+        # 배치마다 본문을 병렬로 가져와 한 번에 저장/커밋
+        with ThreadPoolExecutor(max_workers=settings.confluence_fetch_workers) as executor, \
+                parse_pool_context as parse_pool:
+            while True:
+                pages = list(islice(pages_iter, SYNC_BATCH_SIZE))
+                if not pages:
+                    break
+                result["total_pages"] += len(pages)
                 
-                # Get and parse content
-                html_content = self.get_page_content(page_id)
-                if not html_content:
-                    result["error_count"] += 1
-                    result["errors"].append(f"Failed to fetch page {page_id}")
-                    continue
+                # 이미 저장된 페이지는 배치 단위로 한 번에 조회
+                existing_rows = db.query(
+                    Application.confluence_page_id, Application.id,
+                    Application.content_hash, Application.batch_id
+                ).filter(
+                    Application.confluence_page_id.in_([page["id"] for page in pages])
+                ).all()
+                for page_id, app_id, content_hash, stored_batch_id in existing_rows:
+                    existing_map[page_id] = app_id
+                    stored_state[page_id] = (content_hash, stored_batch_id)
                 
-                parsed_data = self.parse_application(html_content, page_id, page_url)
+                batch_pages = []
+                for page in pages:
+                    if page["id"] in existing_map and not force_update:
+                        logger.debug("Skipping existing page: %s", page["id"])
+                        continue
+                    batch_pages.append(page)
                 
-                # Resolve department by division text
-                if parsed_data.get("division"):
-                    dept = db.query(Department).filter(
-                        Department.name.like(f"%{parsed_data['division']}%")
-                    ).first()
-                    if dept:
-                        parsed_data["department_id"] = dept.id
+                # 버전이 바뀌지 않은 페이지는 캐시된 파싱 결과 사용
+                cached = {}
+                for page in batch_pages:
+                    parsed_data = self._get_cached_parse(page)
+                    if parsed_data is not None:
+                        cached[page["id"]] = parsed_data
                 
-                if batch_id:
-                    parsed_data["batch_id"] = batch_id
+                # Get content (rate limiter는 스레드 간 공유)
+                fetch_ids = [page["id"] for page in batch_pages if page["id"] not in cached]
+                html_map = dict(zip(fetch_ids, executor.map(self.get_page_content, fetch_ids)))
+                content_hashes = {
+                    page_id: _content_hash(html_content)
+                    for page_id, html_content in html_map.items() if html_content
+                }
                 
-                if existing_app:
-                    # Update existing
-                    for key, value in parsed_data.items():
-                        setattr(existing_app, key, value)
-                    result["updated_count"] += 1
-                    print(f"✅ Updated application: {page_id}")
-                else:
-                    # Create new
-                    new_app = Application(**parsed_data)
-                    db.add(new_app)
-                    result["new_count"] += 1
-                    print(f"✅ Created new application: {page_id}")
+                # 파싱 워커가 있으면 본문이 바뀐 페이지를 미리 제출
+                parse_futures = {}
+                if parse_pool is not None:
+                    for page in batch_pages:
+                        page_id = page["id"]
+                        if page_id in content_hashes and not self._is_unchanged(
+                            stored_state.get(page_id), content_hashes[page_id], batch_id
+                        ):
+                            parse_futures[page_id] = parse_pool.submit(
+                                parse_application_html, html_map[page_id], page_id, page["url"]
+                            )
                 
-                db.commit()
+                to_insert: List[Dict[str, Any]] = []
+                to_update: List[Dict[str, Any]] = []
+                for page in batch_pages:
+                    try:
+                        page_id = page["id"]
+                        if page_id in cached:
+                            parsed_data = cached[page_id]
+                            result["cache_hits"] += 1
+                            if self._is_unchanged(stored_state.get(page_id), parsed_data.get("content_hash"), batch_id):
+                                result["unchanged_count"] += 1
+                                continue
+                        else:
+                            html_content = html_map[page_id]
+                            if not html_content:
+                                result["error_count"] += 1
+                                result["errors"].append(f"Failed to fetch page {page_id}")
+                                continue
+                            
+                            content_hash = content_hashes[page_id]
+                            if self._is_unchanged(stored_state.get(page_id), content_hash, batch_id):
+                                result["unchanged_count"] += 1
+                                continue
+                            
+                            if page_id in parse_futures:
+                                parsed_data = parse_futures[page_id].result()
+                            else:
+                                parsed_data = parse_application_html(html_content, page_id, page["url"])
+                            parsed_data["content_hash"] = content_hash
+                            self._cache_parse(page, parsed_data)
+                        
+                        # 캐시된 파싱 결과는 그대로 두고 저장용 행을 새로 만듦
+                        row = {**row_defaults, **parsed_data}
+                        for field in _INTERNED_FIELDS:
+                            value = row.get(field)
+                            if isinstance(value, str):
+                                row[field] = sys.intern(value)
+                        
+                        existing_id = existing_map.get(page_id)
+                        if existing_id is not None:
+                            row["id"] = existing_id
+                            to_update.append(row)
+                        else:
+                            to_insert.append(row)
+                        
+                    except Exception as e:
+                        result["error_count"] += 1
+                        error_msg = f"Error processing page {page['id']}: {str(e)}"
+                        result["errors"].append(error_msg)
+                        logger.error(error_msg)
                 
-            except Exception as e:
-                result["error_count"] += 1
-                error_msg = f"Error processing page {page['id']}: {str(e)}"
-                result["errors"].append(error_msg)
-                print(f"❌ {error_msg}")
-                db.rollback()
+                if to_insert or to_update:
+                    # 이후 배치에 같은 페이지가 다시 나오면 update로 처리
+                    existing_map.update(self._write_batch(db, to_insert, to_update, result))
         
+        logger.info(
+            "Confluence sync finished: %d pages, %d new, %d updated, %d unchanged, %d errors",
+            result["total_pages"], result["new_count"], result["updated_count"],
+            result["unchanged_count"], result["error_count"]
+        )
         return result
 
 
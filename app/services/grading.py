@@ -0,0 +1,25 @@
+"""
+Grading Service
+Shared conversion between letter grades and numeric scores
+"""
+from bisect import bisect_right
+
+# 등급별 점수 (평균 계산용)
+GRADE_SCORES = {"S": 5, "A": 4, "B": 3, "C": 2, "D": 1}
+
+# 평균 점수 구간 경계 (이상이면 다음 등급)
+_GRADE_THRESHOLDS = (1.5, 2.5, 3.5, 4.5)
+_GRADES = ("D", "C", "B", "A", "S")
+
+
+def score_to_grade(score: float) -> str:
+    """
+    Convert numeric score to letter grade
+    
+    Args:
+        score: Average score (1~5)
+    
+    Returns:
+        Grade (S: 4.5 이상, A: 3.5 이상, B: 2.5 이상, C: 1.5 이상, 그 외 D)
+    """
+    return _GRADES[bisect_right(_GRADE_THRESHOLDS, score)]
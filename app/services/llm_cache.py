@@ -0,0 +1,165 @@
+"""
+LLM Response Cache Service
+Persists LLM responses on disk keyed by (model, temperature, prompt)
+"""
+import os
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional
+import orjson
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseCache:
+    """
+    Disk cache for raw LLM response text, fronted by an in-process LRU
+    
+    Usage:
+        key = llm_cache.make_key(model, temperature, prompt)
+        content = llm_cache.get(key)
+        if content is None:
+            content = call_llm(prompt)
+            llm_cache.set(key, content)
+    """
+    
+    def __init__(self, cache_dir: str, memory_size: int = 256, ttl: float = 0):
+        """
+        Initialize response cache
+        
+        Args:
+            cache_dir: Directory to store cached responses
+            memory_size: Max entries kept in memory (0: disk only)
+            ttl: Seconds an entry stays valid (0: never expires)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.memory_size = memory_size
+        self.ttl = ttl
+        self._memory = OrderedDict()
+        # 동기 평가가 여러 스레드에서 호출될 수 있으므로 메모리 계층 보호
+        self._lock = threading.Lock()
+        # 캐시 적중/미스 횟수 (모니터링용)
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def make_key(model: str, temperature: float, prompt: str) -> str:
+        """
+        Build cache key for a request
+        
+        Args:
+            model: Model name
+            temperature: Sampling temperature
+            prompt: Prompt text
+        
+        Returns:
+            Hex digest key
+        """
+        payload = orjson.dumps(
+            {"model": model, "temperature": temperature, "prompt": prompt},
+            option=orjson.OPT_SORT_KEYS
+        )
+        return hashlib.blake2b(payload, digest_size=20).hexdigest()
+    
+    def _path(self, key: str) -> Path:
+        """Cache file path (하위 디렉토리로 분산)"""
+        return self.cache_dir / key[:2] / f"{key}.txt"
+    
+    def get(self, key: str) -> Optional[str]:
+        """
+        Get cached response
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached response text or None
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and not self._expired(entry[1], now):
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+        
+        content = None
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                # 파일 수정 시각 = 저장 시각 (set은 항상 새 파일로 교체)
+                stored_at = os.fstat(f.fileno()).st_mtime
+                if not self._expired(stored_at, now):
+                    content = f.read()
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("LLM cache read failed (%s): %s", key, e)
+        
+        with self._lock:
+            if content is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._remember(key, content, stored_at)
+        return content
+    
+    def set(self, key: str, content: str):
+        """
+        Store response atomically
+        
+        임시 파일에 쓴 뒤 os.replace로 교체하므로 동시에 쓰거나 읽어도
+        중간 상태의 파일이 보이지 않음
+        
+        Args:
+            key: Cache key
+            content: Response text
+        """
+        with self._lock:
+            self._remember(key, content, time.time())
+        
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(content)
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("LLM cache write failed (%s): %s", key, e)
+    
+    def _expired(self, stored_at: float, now: float) -> bool:
+        """Whether an entry stored at stored_at is past the TTL"""
+        return self.ttl > 0 and now - stored_at > self.ttl
+    
+    def _remember(self, key: str, content: str, stored_at: float):
+        """Put entry into the memory tier, evicting the least recently used (caller holds the lock)"""
+        if self.memory_size <= 0:
+            return
+        self._memory[key] = (content, stored_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+    
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache hit statistics
+        
+        Returns:
+            {"hits", "misses", "memory_entries"}
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "memory_entries": len(self._memory)}
+
+
+# Singleton instance
+llm_cache = LLMResponseCache(settings.llm_cache_dir, settings.llm_cache_memory_size, settings.llm_cache_ttl)
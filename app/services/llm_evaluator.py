@@ -1,101 +1,406 @@
 """
 LLM Evaluator Service
 """
+import re
+import time
 import uuid
 import json
+import hashlib
+import asyncio
+import logging
+import weakref
+import unicodedata
+from contextlib import nullcontext
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+import httpx
+import openai
+import orjson
 from sqlalchemy.orm import Session
+from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from tenacity import (
+    RetryCallState, before_sleep_log, retry, retry_if_exception_type, stop_after_attempt,
+    wait_fixed, wait_random_exponential
+)
 from app.config import settings
 from app.models.application import Application
 from app.models.evaluation import EvaluationCriteria, EvaluationHistory
-from app.services.rate_limiter import RateLimiter
+from app.schemas.evaluation import AIEvaluationResult
+from app.services.grading import GRADE_SCORES, score_to_grade
+from app.services.llm_cache import llm_cache
+from app.services.rate_limiter import TokenBucketLimiter
 
+logger = logging.getLogger(__name__)
 
-class LLMEvaluator:
-    """LLM-based application evaluator"""
+# 재시도할 일시적 오류 (인증 실패, 400 등은 재시도하지 않음)
+TRANSIENT_ERRORS = (
+    # 연결/타임아웃/스트리밍 도중 끊김 등 전송 계층 오류 전체
+    httpx.TransportError,
+    openai.APIConnectionError,
+    openai.RateLimitError,
+    openai.InternalServerError,
+)
+# 응답 JSON 파싱 실패 (재시도하지 않고 짧은 수정 요청으로 1회 복구)
+PARSE_ERRORS = (json.JSONDecodeError,)
+
+# 동시 호출이 같은 시각에 재시도하지 않도록 지터를 둔 지수 백오프
+_backoff = wait_random_exponential(multiplier=1, min=1, max=20)
+# Retry-After 없는 429는 한도가 회복될 때까지 더 길게 대기 (최소 4초)
+_rate_limit_backoff = wait_fixed(4) + wait_random_exponential(multiplier=4, max=56)
+
+
+def _retry_wait(retry_state: RetryCallState) -> float:
+    """
+    Wait time before the next LLM retry
+    
+    - 429: 서버가 보낸 Retry-After 만큼 대기 (없으면 최대 60초 백오프)
+    - 그 외: 지터를 둔 지수 백오프 (최대 20초)
+    """
+    error = retry_state.outcome.exception()
+    if isinstance(error, openai.RateLimitError):
+        try:
+            return min(60.0, float(error.response.headers["retry-after"]))
+        except (KeyError, TypeError, ValueError):
+            return _rate_limit_backoff(retry_state)
+    return _backoff(retry_state)
+
+
+# LLM 호출 재시도 정책 (sync/async 공용, async 함수에는 asyncio.sleep으로 대기)
+_llm_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=_retry_wait,
+    retry=retry_if_exception_type(TRANSIENT_ERRORS),
+    reraise=True,
+    before_sleep=before_sleep_log(logger, logging.WARNING)
+)
+
+# 활성 평가 기준 캐시 유지 시간 (초)
+_CRITERIA_CACHE_TTL = 30.0
+
+# 토큰 예산 계산 시 응답 토큰 추정치
+_MAX_OUTPUT_TOKENS = 1024
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Estimate token count of a prompt
+    
+    UTF-8 바이트 수 / 4 근사치 (한글 1자 ≈ 0.75 토큰)
+    
+    Args:
+        text: Prompt text
+        
+    Returns:
+        Estimated token count
+    """
+    return len(text.encode("utf-8")) // 4
+
+
+# 프롬프트에 넣을 항목별 최대 토큰 수 (추정치 기준)
+_FIELD_TOKEN_LIMITS = {
+    "current_work": 600,
+    "pain_point": 600,
+    "improvement_idea": 600,
+    "expected_effect": 400,
+    "hope": 300,
+    "pre_survey": 400,
+    "tech_capabilities": 400,
+}
+# 프롬프트 전체 최대 토큰 수와, 초과 시 생략하는 항목 (앞에서부터)
+_MAX_PROMPT_TOKENS = 6000
+_DROPPABLE_FIELDS = ("tech_capabilities", "pre_survey")
+_TRUNCATED = "... [truncated]"
+_OMITTED = "N/A (분량 초과로 생략)"
+
+
+def _truncate_for_prompt(text: str, max_tokens: int) -> str:
+    """
+    Cut text to roughly max_tokens (same estimate as estimate_tokens)
+    
+    Args:
+        text: Field text
+        max_tokens: Token budget for the field
+        
+    Returns:
+        Original text, or truncated text with a marker
+    """
+    max_bytes = max_tokens * 4
+    encoded = text.encode("utf-8")
+    if len(encoded) <= max_bytes:
+        return text
+    # 멀티바이트 문자 중간에서 잘린 바이트는 버림
+    return encoded[:max_bytes].decode("utf-8", errors="ignore") + _TRUNCATED
+
+
+def _dump_json(value: Any) -> str:
+    """Serialize survey/capability JSON for the prompt"""
+    if not value:
+        return 'N/A'
+    # orjson은 항상 UTF-8 그대로 출력 (ensure_ascii=False와 동일한 결과)
+    return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+# 지원서별 JSON 직렬화 결과 (캐시 키 계산과 프롬프트 생성, 재평가에서 재사용)
+_json_dump_cache: "weakref.WeakKeyDictionary[Application, Dict[str, Tuple[Any, str]]]" = weakref.WeakKeyDictionary()
+
+
+def _dump_application_json(application: Application, field: str) -> str:
+    """
+    Serialize a JSON column of an application once
+    
+    속성에 새 값이 할당되면 값 객체가 바뀌므로 다시 직렬화
+    (값을 제자리에서 수정하는 경우는 SQLAlchemy도 변경을 감지하지 않으므로 고려하지 않음)
+    
+    Args:
+        application: Application
+        field: JSON column name (pre_survey, tech_capabilities)
+        
+    Returns:
+        Serialized text for the prompt
+    """
+    value = getattr(application, field)
+    dumps = _json_dump_cache.setdefault(application, {})
+    cached = dumps.get(field)
+    if cached is not None and cached[0] is value:
+        return cached[1]
+    dumped = _dump_json(value)
+    dumps[field] = (value, dumped)
+    return dumped
+
+
+def _department_info(application: Application) -> str:
+    """
+    Build the organization string shown in the prompt
+    
+    Args:
+        application: Application (department는 joinedload로 미리 로드 권장)
+        
+    Returns:
+        "division > department" text
+    """
+    department_name = application.department.name if application.department else 'N/A'
+    return f"{application.division or 'N/A'} > {department_name}"
+
+
+def _canonical_text(value: Any) -> Any:
+    """
+    Normalize a prompt field for the result cache key
+    
+    유니코드 정규화(NFKC)와 공백 정리만 하므로 줄바꿈/띄어쓰기/전각 문자만 다른
+    재제출은 같은 키가 되고, 단어가 하나라도 다르면 다른 키가 됨
+    
+    Args:
+        value: Field value
+        
+    Returns:
+        Canonical text (non-string values unchanged)
+    """
+    if not isinstance(value, str):
+        return value
+    return " ".join(unicodedata.normalize("NFKC", value).split())
+
+
+def _criteria_digest(criteria_list: Optional[List[EvaluationCriteria]]) -> str:
+    """
+    Fingerprint of the evaluation criteria and grade scale for the result cache key
+    
+    관리자가 평가 기준을 수정하면 이전 기준으로 저장된 결과를 다시 쓰지 않도록 함
+    
+    Args:
+        criteria_list: Active evaluation criteria
+        
+    Returns:
+        Hex digest
+    """
+    payload = orjson.dumps({
+        "criteria": [
+            [c.id, c.batch_id, c.name, c.description, c.weight, c.evaluation_guide, c.display_order]
+            for c in criteria_list or []
+        ],
+        "grade_scores": GRADE_SCORES,
+    }, option=orjson.OPT_SORT_KEYS)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _commit_keep_loaded(db: Session):
+    """
+    Commit without expiring loaded objects
+    
+    일괄 평가 중간 커밋 후에도 평가 중인 지원서를 다시 조회하지 않도록 함
+    
+    Args:
+        db: Database session
+    """
+    expire_on_commit = db.expire_on_commit
+    db.expire_on_commit = False
+    try:
+        db.commit()
+    finally:
+        db.expire_on_commit = expire_on_commit
+
+
+def _message_id_headers() -> Dict[str, str]:
+    """Fresh Prompt/Completion message ids for one LLM request"""
+    return {
+        "Prompt-Msg-Id": str(uuid.uuid4()),
+        "Completion-Msg-Id": str(uuid.uuid4()),
+    }
+
+
+# Markdown 코드 블록 (```json 블록 우선, 닫는 펜스가 없으면 끝까지)
+_JSON_FENCE_RE = re.compile(r"```json\s*(.*?)(?:```|\Z)", re.DOTALL)
+_ANY_FENCE_RE = re.compile(r"```\s*(.*?)(?:```|\Z)", re.DOTALL)
+# 닫는 괄호 앞의 불필요한 쉼표 (LLM이 자주 내는 JSON 오류)
+_TRAILING_COMMA_RE = re.compile(r",(\s*[}\]])")
+
+
+def _iter_json_objects(text: str) -> Iterator[str]:
+    """
+    Yield top-level {...} segments of text in one linear pass
+    
+    문자열 리터럴 안의 괄호와 이스케이프(\\")는 깊이 계산에서 제외
+    
+    Args:
+        text: LLM response text
+        
+    Yields:
+        Balanced JSON object candidates
+    """
+    yield from _JsonObjectScanner().feed(text)
+
+
+class _JsonObjectScanner:
+    """
+    Incremental top-level {...} finder
+    
+    스트리밍 응답은 청크가 들어올 때마다 새로 받은 문자만 검사
+    """
     
     def __init__(self):
-        self.llm = ChatOpenAI(
-            base_url=settings.llm_api_base_url,
-            api_key=settings.llm_api_key,
-            model=settings.llm_model_name,
-            temperature=0.1,  # 일관성 확보
-            default_headers={
-                "x-dep-ticket": settings.llm_credential_key,
-                "Send-System-Name": settings.llm_system_name,
-                "User-ID": settings.llm_user_id,
-                "User-Type": "AD",
-                "Prompt-Msg-Id": str(uuid.uuid4()),
-                "Completion-Msg-Id": str(uuid.uuid4()),
-            },
-        )
-        # Rate limiter: 20 calls per minute
-        self.rate_limiter = RateLimiter(max_calls=20, time_window=60)
+        self.text = ""
+        self.depth = 0
+        self.start = 0
+        self.in_string = False
+        self.escape = False
     
-    def build_evaluation_prompt(
-        self, 
-        application: Application, 
-        criteria_list: List[EvaluationCriteria]
-    ) -> str:
+    def feed(self, chunk: str) -> List[str]:
         """
-        Build evaluation prompt for LLM
+        Scan the next piece of text
         
         Args:
-            application: Application to evaluate
-            criteria_list: List of evaluation criteria
+            chunk: Newly received text
             
         Returns:
-            Formatted prompt string
+            JSON object candidates completed within this chunk
         """
-        # 과제 정보 구성
-        department_info = f"{application.division or 'N/A'} > {application.department.name if application.department else 'N/A'}"
+        offset = len(self.text)
+        self.text += chunk
+        depth, start, in_string, escape = self.depth, self.start, self.in_string, self.escape
+        objects = []
+        for i, ch in enumerate(chunk, offset):
+            if in_string:
+                if escape:
+                    escape = False
+                elif ch == "\\":
+                    escape = True
+                elif ch == '"':
+                    in_string = False
+            elif ch == '"':
+                # 객체 밖의 따옴표(설명 문장)는 무시
+                in_string = depth > 0
+            elif ch == "{":
+                if depth == 0:
+                    start = i
+                depth += 1
+            elif ch == "}" and depth:
+                depth -= 1
+                if depth == 0:
+                    objects.append(self.text[start:i + 1])
+        self.depth, self.start, self.in_string, self.escape = depth, start, in_string, escape
+        return objects
+
+
+def _first_json_object(candidates: List[str]) -> Optional[str]:
+    """
+    Return the first candidate that parses as a JSON object
+    
+    Args:
+        candidates: Balanced {...} segments
         
-        system_prompt = f"""당신은 글로벌 반도체 대기업의 AI 전문가입니다.
-조직: {department_info}
+    Returns:
+        Candidate text, or None
+    """
+    for candidate in candidates:
+        try:
+            if isinstance(_extract_json_from_text(candidate), dict):
+                return candidate
+        except json.JSONDecodeError:
+            continue
+    return None
+
+
+def _extract_json_from_text(text: str) -> Dict[str, Any]:
+    """
+    Extract the JSON object from an LLM response
+    
+    1) 응답 전체를 그대로 파싱
+    2) Markdown 코드 블록 내용 파싱
+    3) 괄호 깊이 스캔으로 찾은 {...} 구간 파싱
+    4) 모두 실패하면 닫는 괄호 앞 쉼표를 지우고 1~3 반복 (LLM 재호출보다 저렴)
+    
+    Args:
+        text: LLM response text
+        
+    Returns:
+        Parsed JSON object
+        
+    Raises:
+        json.JSONDecodeError: If no JSON object can be parsed
+    """
+    text = text.strip()
+    candidates = [text]
+    if "```" in text:
+        fence = _JSON_FENCE_RE.search(text) or _ANY_FENCE_RE.search(text)
+        candidates.append(fence.group(1).strip())
+    
+    error = json.JSONDecodeError("No JSON object found", text, 0)
+    for candidate in chain(candidates, _iter_json_objects(text)):
+        try:
+            result = orjson.loads(candidate)
+        except orjson.JSONDecodeError:
+            try:
+                # orjson은 문자열 안의 줄바꿈 등 제어 문자를 거부하므로 strict=False로 재시도
+                result = json.loads(candidate, strict=False)
+            except json.JSONDecodeError as e:
+                error = e
+                continue
+        if isinstance(result, dict):
+            return result
+    
+    cleaned = _TRAILING_COMMA_RE.sub(r"\1", text)
+    if cleaned != text:
+        return _extract_json_from_text(cleaned)
+    raise error
+
+
+# 평가 프롬프트 구성 요소 (정적 텍스트는 모듈 로드 시 한 번만 생성)
+# 모든 과제에 공통인 지시문을 앞에, 과제별 내용을 뒤에 두어 프롬프트 앞부분이
+# 요청 간에 동일하게 유지되도록 함 (서버 prefix 캐시 재사용, 예: vLLM --enable-prefix-caching)
+_SYSTEM_PROMPT = """당신은 글로벌 반도체 대기업의 AI 전문가입니다.
 
 역할: 지원서 내용을 객관적으로 요약하고 분석합니다.
 
 중요 원칙:
 1. 지원서에 작성된 내용만을 기반으로 요약 (할루시네이션 금지)
-2. {department_info} 조직의 업무 특성을 고려한 해석
+2. 지원 조직(과제 기본 정보의 '조직')의 업무 특성을 고려한 해석
 3. 사실 기반의 객관적 분석
 4. 과장하거나 추측하지 말 것
 """
 
-        app_info = f"""
-# AI 과제 지원서 평가
-
-## 과제 기본 정보
-- 과제명: {application.subject or 'N/A'}
-- 조직: {department_info}
-- 참여 인원: {application.participant_count or 'N/A'}명
-- 대표자: {application.representative_name or 'N/A'}
-
-## 신청 내용
-### 현재 업무
-{application.current_work or 'N/A'}
-
-### Pain Point (해결하고자 하는 문제)
-{application.pain_point or 'N/A'}
-
-### 개선 아이디어
-{application.improvement_idea or 'N/A'}
-
-### 기대 효과
-{application.expected_effect or 'N/A'}
-
-### 바라는 점
-{application.hope or 'N/A'}
-
-## 사전 설문
-{json.dumps(application.pre_survey, ensure_ascii=False, indent=2) if application.pre_survey else 'N/A'}
-
-## 참여자 기술 역량
-{json.dumps(application.tech_capabilities, ensure_ascii=False, indent=2) if application.tech_capabilities else 'N/A'}
-
+_SUMMARY_REQUEST = """
 ---
 
 ## 요약 요청사항
@@ -112,7 +417,7 @@ class LLMEvaluator:
 - **강화학습**: 학습 기반 의사결정, 시뮬레이션 최적화
 
 ### 2. 조직 관점의 경영효과
-{department_info} 조직 관점에서 이 과제의 경영효과를 요약하세요 (2-3문장):
+지원 조직 관점에서 이 과제의 경영효과를 요약하세요 (2-3문장):
 - 지원서에 작성된 기대효과 기반으로만 작성
 - 추측이나 과장 금지
 
@@ -129,17 +434,25 @@ class LLMEvaluator:
 4. 기대 효과 (1줄)
 5. 구현 계획 (1줄)
 """
-        
-        prompt = f"""{system_prompt}
 
-{app_info}
+# 단건/배치 응답 형식에 공통인 규칙
+_RESPONSE_RULES = """
+**중요 규칙:**
+1. 유효한 JSON 형식 필수
+2. ai_category는 6개 선택지 중 하나만 (예측/분류/챗봇/에이전트/최적화/강화학습)
+3. 지원서에 작성된 내용만 사용 (할루시네이션 금지)
+4. 추측이나 과장 금지 - 사실만 기반
+5. 지원 조직 특성 반영
+6. 간결하고 명확하게 (요약의 목적)
+"""
 
+_RESPONSE_FORMAT = """
 ---
 
 ## 응답 형식 (JSON)
 다음 JSON 형식으로 정확히 응답하세요:
 
-{{
+{
   "ai_category": "예측" 또는 "분류" 또는 "챗봇" 또는 "에이전트" 또는 "최적화" 또는 "강화학습",
   "business_impact": "조직 관점의 경영효과를 2-3문장으로 요약 (지원서 내용 기반)",
   "technical_feasibility": "AI 관점의 구현 가능성을 2-3문장으로 평가 (지원서 내용 기반)",
@@ -150,29 +463,406 @@ class LLMEvaluator:
     "4. 기대 효과",
     "5. 구현 계획"
   ]
-}}
+}
+""" + _RESPONSE_RULES
 
-**중요 규칙:**
-1. 유효한 JSON 형식 필수
-2. ai_category는 6개 선택지 중 하나만 (예측/분류/챗봇/에이전트/최적화/강화학습)
-3. 지원서에 작성된 내용만 사용 (할루시네이션 금지)
-4. 추측이나 과장 금지 - 사실만 기반
-5. {department_info} 조직 특성 반영
-6. 간결하고 명확하게 (요약의 목적)
+# 배치 요청 전용 응답 형식 (단건 형식과 함께 보내면 형식 지시가 충돌하므로 대신 사용)
+_BATCH_RESPONSE_FORMAT = """
+---
+
+## 응답 형식 (JSON)
+사용자 메시지의 지원서 각각을 요약해 다음 JSON 형식으로 정확히 응답하세요.
+results에는 지원서 순서대로, 지원서 수와 같은 개수의 결과 객체를 넣으세요:
+
+{
+  "results": [
+    {
+      "ai_category": "예측" 또는 "분류" 또는 "챗봇" 또는 "에이전트" 또는 "최적화" 또는 "강화학습",
+      "business_impact": "조직 관점의 경영효과를 2-3문장으로 요약 (지원서 내용 기반)",
+      "technical_feasibility": "AI 관점의 구현 가능성을 2-3문장으로 평가 (지원서 내용 기반)",
+      "five_line_summary": ["1. 과제 목적", "2. 현재 문제", "3. 해결 방안", "4. 기대 효과", "5. 구현 계획"]
+    }
+  ]
+}
+""" + _RESPONSE_RULES
+
+
+# 모든 요청에서 바이트 단위로 동일한 앞부분 (system 메시지로 전송, 사용자 메시지에는 과제별 내용만)
+_STATIC_PROMPT_PREFIX = _SYSTEM_PROMPT + _SUMMARY_REQUEST + _RESPONSE_FORMAT
+_BATCH_STATIC_PROMPT_PREFIX = _SYSTEM_PROMPT + _SUMMARY_REQUEST + _BATCH_RESPONSE_FORMAT
+
+
+def _system_content(text: str) -> Any:
+    """
+    System message content for a static prefix
+    
+    Anthropic 호환 게이트웨이는 cache_control 표시가 있는 구간만 프롬프트 캐시에 저장
+    
+    Args:
+        text: Static prompt prefix
+        
+    Returns:
+        Plain text, or a text part tagged with cache_control
+    """
+    if settings.llm_prompt_cache_control:
+        return [{"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}]
+    return text
+
+
+_SYSTEM_CONTENT = _system_content(_STATIC_PROMPT_PREFIX)
+_SYSTEM_MESSAGE = SystemMessage(content=_SYSTEM_CONTENT)
+_SYSTEM_PROMPT_TOKENS = estimate_tokens(_STATIC_PROMPT_PREFIX)
+_BATCH_SYSTEM_CONTENT = _system_content(_BATCH_STATIC_PROMPT_PREFIX)
+_BATCH_SYSTEM_MESSAGE = SystemMessage(content=_BATCH_SYSTEM_CONTENT)
+_BATCH_SYSTEM_PROMPT_TOKENS = estimate_tokens(_BATCH_STATIC_PROMPT_PREFIX)
+
+_APP_INFO_TEMPLATE = """
+---
+
+# AI 과제 지원서 평가
+
+## 과제 기본 정보
+- 과제명: {subject}
+- 조직: {department_info}
+- 참여 인원: {participant_count}명
+- 대표자: {representative_name}
+
+## 신청 내용
+### 현재 업무
+{current_work}
+
+### Pain Point (해결하고자 하는 문제)
+{pain_point}
+
+### 개선 아이디어
+{improvement_idea}
+
+### 기대 효과
+{expected_effect}
+
+### 바라는 점
+{hope}
+
+## 사전 설문
+{pre_survey}
+
+## 참여자 기술 역량
+{tech_capabilities}
 """
-        return prompt
+
+_APP_INFO_INSTRUCTION = """
+---
+
+위 지원서를 요약 요청사항에 따라 응답 형식(JSON)으로 요약하세요.
+"""
+
+# 지원서별 내용을 제외한 단건 프롬프트의 UTF-8 바이트 수 (분량 한도 계산용)
+_FIXED_PROMPT_BYTES = len((_STATIC_PROMPT_PREFIX + _APP_INFO_INSTRUCTION).encode("utf-8"))
+
+# 배치 프롬프트: 지원서 여러 건을 한 요청에 담고 결과를 배열로 받음
+_BATCH_APP_HEADER = """
+=== 지원서 {index} ===
+"""
+
+_BATCH_INSTRUCTION = """
+---
+
+위 지원서 {count}건을 각각 요약 요청사항에 따라 요약하고,
+results에 지원서 순서대로 {count}개의 결과를 넣어 응답 형식(JSON)으로 응답하세요.
+"""
+
+# JSON 파싱 실패 시 원래 프롬프트 대신 보내는 짧은 수정 요청
+_REPAIR_PROMPT = """이전 응답이 유효한 JSON이 아닙니다.
+설명이나 코드 블록 없이 아래 응답의 내용을 담은 JSON 객체만 다시 출력하세요.
+
+이전 응답:
+{response}
+"""
+
+# 프롬프트 틀이나 분량 제한이 바뀌면 지원서 단위 캐시 키도 달라지도록 키에 포함
+_PROMPT_TEMPLATE_DIGEST = hashlib.blake2b(
+    (
+        _STATIC_PROMPT_PREFIX + _APP_INFO_TEMPLATE + _APP_INFO_INSTRUCTION
+        + repr(sorted(_FIELD_TOKEN_LIMITS.items())) + repr(_DROPPABLE_FIELDS) + str(_MAX_PROMPT_TOKENS)
+    ).encode(),
+    digest_size=8
+).hexdigest()
+
+
+def _chat_messages(prompt: str, batch: bool = False) -> List[Any]:
+    """
+    LangChain messages for one request (shared system message + user prompt)
+    
+    Args:
+        prompt: User message text
+        batch: Use the batch response format system message
+        
+    Returns:
+        [SystemMessage, HumanMessage]
+    """
+    return [_BATCH_SYSTEM_MESSAGE if batch else _SYSTEM_MESSAGE, HumanMessage(content=prompt)]
+
+
+def _chat_message_dicts(prompt: str, batch: bool = False) -> List[Dict[str, Any]]:
+    """
+    Chat completion messages for one request (SDK / Batch API 형식)
+    
+    Args:
+        prompt: User message text
+        batch: Use the batch response format system message
+        
+    Returns:
+        [system, user] message dicts
+    """
+    return [
+        {"role": "system", "content": _BATCH_SYSTEM_CONTENT if batch else _SYSTEM_CONTENT},
+        {"role": "user", "content": prompt},
+    ]
+
+
+@lru_cache(maxsize=1024)
+def _render_app_info(items: Tuple[Tuple[str, Any], ...]) -> str:
+    """
+    Render the application section from prompt field values
+    
+    값이 같으면 이전 결과를 그대로 사용 (재시도, 배치 실패 후 단건 재평가 등)
+    
+    Args:
+        items: (field, value) pairs from _prompt_fields
+        
+    Returns:
+        Application section (fields truncated/omitted to fit the prompt cap)
+    """
+    fields = dict(items)
+    for field, max_tokens in _FIELD_TOKEN_LIMITS.items():
+        fields[field] = _truncate_for_prompt(fields[field], max_tokens)
+    
+    app_info = _APP_INFO_TEMPLATE.format_map(fields)
+    
+    # 단건 프롬프트 기준 전체 한도를 넘으면 덜 중요한 항목부터 생략
+    # (estimate_tokens와 같은 계산을 전체 프롬프트 문자열을 만들지 않고 수행)
+    for field in _DROPPABLE_FIELDS:
+        if (_FIXED_PROMPT_BYTES + len(app_info.encode("utf-8"))) // 4 <= _MAX_PROMPT_TOKENS:
+            break
+        fields[field] = _OMITTED
+        app_info = _APP_INFO_TEMPLATE.format_map(fields)
+    return app_info
+
+
+class LLMEvaluator:
+    """LLM-based application evaluator"""
+    
+    def __init__(self):
+        default_headers = {
+            "x-dep-ticket": settings.llm_credential_key,
+            "Send-System-Name": settings.llm_system_name,
+            "User-ID": settings.llm_user_id,
+            "User-Type": "AD",
+        }
+        # 프로세스 전체에서 재사용하는 HTTP 커넥션 풀 (shutdown 시 aclose)
+        # 요청 간격이 RPM 제한으로 벌어져도 연결이 유지되도록 keep-alive를 길게 둠
+        limits = httpx.Limits(max_keepalive_connections=64, max_connections=256, keepalive_expiry=60)
+        # HTTP/2: 동시 요청을 연결 하나에 다중화 (h2 패키지 필요)
+        self.http_client = httpx.Client(limits=limits, http2=settings.llm_http2)
+        self.async_http_client = httpx.AsyncClient(limits=limits, http2=settings.llm_http2)
+        client_params = {
+            "api_key": settings.llm_api_key,
+            "base_url": settings.llm_api_base_url,
+            "default_headers": default_headers,
+        }
+        # Batch API 등 LangChain이 감싸지 않는 엔드포인트 호출용
+        self.openai_client = openai.OpenAI(**client_params, http_client=self.http_client)
+        
+        self.llm = ChatOpenAI(
+            base_url=settings.llm_api_base_url,
+            api_key=settings.llm_api_key,
+            model=settings.llm_model_name,
+            temperature=0.1,  # 일관성 확보
+            default_headers=default_headers,
+            client=self.openai_client.chat.completions,
+            async_client=openai.AsyncOpenAI(**client_params, http_client=self.async_http_client).chat.completions,
+            # JSON 모드: 서버가 유효한 JSON 객체만 생성하도록 강제
+            model_kwargs=(
+                {"response_format": {"type": "json_object"}} if settings.llm_json_mode else {}
+            ),
+        )
+        # RPM/TPM 토큰 버킷 (sync/async 경로가 같은 예산을 사용)
+        self.token_limiter = TokenBucketLimiter(
+            requests_per_minute=settings.llm_requests_per_minute,
+            tokens_per_minute=settings.llm_tokens_per_minute
+        )
+        # (조회 시각, 활성 평가 기준) - get_active_criteria 참고
+        self._criteria_cache: Tuple[float, Optional[List[EvaluationCriteria]]] = (0.0, None)
+    
+    async def aclose(self):
+        """Close the shared HTTP connection pools"""
+        await self.async_http_client.aclose()
+        self.http_client.close()
+    
+    def get_active_criteria(self, db: Session) -> List[EvaluationCriteria]:
+        """
+        Get active evaluation criteria, cached for _CRITERIA_CACHE_TTL seconds
+        
+        별도 세션에서 읽어 분리(detached)된 객체를 캐시하므로 호출자 세션의
+        커밋/롤백으로 만료되지 않음 (읽기 전용으로 사용)
+        
+        Args:
+            db: Database session (connection bind only)
+            
+        Returns:
+            Active criteria ordered by display_order
+        """
+        loaded_at, criteria = self._criteria_cache
+        if criteria is not None and time.monotonic() - loaded_at < _CRITERIA_CACHE_TTL:
+            return criteria
+        
+        with Session(db.get_bind()) as session:
+            criteria = session.query(EvaluationCriteria).filter(
+                EvaluationCriteria.is_active == True
+            ).order_by(EvaluationCriteria.display_order).all()
+        self._criteria_cache = (time.monotonic(), criteria)
+        return criteria
+    
+    def refresh_criteria(self):
+        """Drop cached criteria (call after evaluation criteria are edited)"""
+        self._criteria_cache = (0.0, None)
+    
+    def build_evaluation_prompt(
+        self, 
+        application: Application, 
+        criteria_list: List[EvaluationCriteria],
+        department_info: Optional[str] = None
+    ) -> str:
+        """
+        Build evaluation prompt for LLM
+        
+        Args:
+            application: Application to evaluate
+            criteria_list: List of evaluation criteria
+            department_info: Precomputed organization string (optional, computed if None)
+            
+        Returns:
+            User message text (공통 지시문은 system 메시지로 따로 전송)
+        """
+        app_info = self._build_app_info(application, department_info)
+        return "".join((app_info, _APP_INFO_INSTRUCTION))
+    
+    def build_batch_evaluation_prompt(
+        self,
+        applications: List[Application],
+        criteria_list: List[EvaluationCriteria]
+    ) -> str:
+        """
+        Build one prompt that evaluates several applications
+        
+        공통 지시문(system 메시지)은 한 번만 보내고 지원서별 내용을 이어 붙임
+        
+        Args:
+            applications: Applications to evaluate (response order)
+            criteria_list: List of evaluation criteria
+            
+        Returns:
+            User message text
+        """
+        parts = []
+        for index, application in enumerate(applications, 1):
+            parts.append(_BATCH_APP_HEADER.format(index=index))
+            parts.append(self._build_app_info(application))
+        parts.append(_BATCH_INSTRUCTION.format(count=len(applications)))
+        return "".join(parts)
+    
+    def _build_app_info(self, application: Application, department_info: Optional[str] = None) -> str:
+        """
+        Render the per-application part of the prompt
+        
+        Args:
+            application: Application to evaluate
+            department_info: Precomputed organization string (optional)
+            
+        Returns:
+            Application section (fields truncated/omitted to fit the prompt cap)
+        """
+        fields = self._prompt_fields(application, department_info)
+        return _render_app_info(tuple(fields.items()))
+    
+    def _prompt_fields(self, application: Application, department_info: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Collect the application values that go into the prompt
+        
+        Args:
+            application: Application to evaluate
+            department_info: Precomputed organization string (optional)
+            
+        Returns:
+            Template fields (before truncation)
+        """
+        # 과제 정보 구성 (조직 정보와 JSON 직렬화는 한 번만 계산)
+        if department_info is None:
+            department_info = _department_info(application)
+        fields = {
+            "department_info": department_info,
+            "subject": application.subject or 'N/A',
+            "participant_count": application.participant_count or 'N/A',
+            "representative_name": application.representative_name or 'N/A',
+            "current_work": application.current_work or 'N/A',
+            "pain_point": application.pain_point or 'N/A',
+            "improvement_idea": application.improvement_idea or 'N/A',
+            "expected_effect": application.expected_effect or 'N/A',
+            "hope": application.hope or 'N/A',
+            "pre_survey": _dump_application_json(application, "pre_survey"),
+            "tech_capabilities": _dump_application_json(application, "tech_capabilities"),
+        }
+        return fields
     
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=4, max=60),
-        retry=retry_if_exception_type(Exception)
-    )
-    def evaluate_with_llm(self, prompt: str) -> Dict[str, Any]:
+    @_llm_retry
+    def evaluate_with_llm(self, prompt: str, use_cache: Optional[bool] = None) -> Dict[str, Any]:
         """
         Evaluate application using LLM with retry logic
         
         Args:
             prompt: Evaluation prompt
+            use_cache: Use the response cache (None: settings.llm_cache_enabled)
+            
+        Returns:
+            Evaluation result dictionary
+            
+        Raises:
+            Exception: If evaluation fails after retries
+        """
+        cache_key = self._cache_key(prompt, use_cache)
+        if cache_key:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return self._parse_llm_response(cached)
+        
+        content = self._invoke(prompt)
+        try:
+            result = self._parse_llm_response(content)
+        except PARSE_ERRORS:
+            # 같은 긴 프롬프트를 다시 보내지 않고 짧은 수정 요청 1회
+            content = self._invoke(_REPAIR_PROMPT.format(response=content))
+            result = self._parse_llm_response(content)
+        # 파싱에 성공한 응답만 캐시
+        if cache_key:
+            llm_cache.set(cache_key, content)
+        return result
+    
+    @_llm_retry
+    async def aevaluate_with_llm(
+        self,
+        prompt: str,
+        use_cache: Optional[bool] = None,
+        max_output_tokens: int = _MAX_OUTPUT_TOKENS,
+        batch: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Evaluate application using LLM with retry logic (async)
+        
+        Args:
+            prompt: Evaluation prompt
+            use_cache: Use the response cache (None: settings.llm_cache_enabled)
+            max_output_tokens: Expected response tokens for the token budget
+            batch: Prompt from build_batch_evaluation_prompt (batch response format)
             
         Returns:
             Evaluation result dictionary
@@ -180,25 +870,206 @@ class LLMEvaluator:
         Raises:
             Exception: If evaluation fails after retries
         """
-        # Apply rate limiting before LLM call
-        self.rate_limiter.wait_if_needed()
+        cache_key = self._cache_key(prompt, use_cache)
+        if cache_key:
+            cached = llm_cache.get(cache_key)
+            if cached is not None:
+                return self._parse_llm_response(cached)
         
-        response = self.llm.invoke(prompt)
-        content = response.content
+        content = await self._ainvoke(prompt, max_output_tokens, batch)
+        try:
+            result = self._parse_llm_response(content)
+        except PARSE_ERRORS:
+            repair_prompt = _REPAIR_PROMPT.format(response=content)
+            content = await self._ainvoke(repair_prompt, max_output_tokens, batch)
+            result = self._parse_llm_response(content)
+        if cache_key:
+            llm_cache.set(cache_key, content)
+        return result
+    
+    def _invoke(self, prompt: str, max_output_tokens: int = _MAX_OUTPUT_TOKENS) -> str:
+        """
+        Send one prompt to the LLM
         
-        # JSON 파싱 시도
+        Args:
+            prompt: Prompt text
+            max_output_tokens: Expected response tokens for the token budget
+            
+        Returns:
+            Response text
+        """
+        # async 경로와 같은 RPM/TPM 예산에서 차감 (부족하면 스레드에서 대기)
+        self.token_limiter.wait(_SYSTEM_PROMPT_TOKENS + estimate_tokens(prompt) + max_output_tokens)
+        
+        # 메시지 ID는 요청마다 새로 발급
         try:
-            # Markdown code block 제거
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            elif "```" in content:
-                content = content.split("```")[1].split("```")[0]
+            if settings.llm_streaming:
+                return self._stream_json(prompt)
+            return self.llm.invoke(_chat_messages(prompt), extra_headers=_message_id_headers()).content
+        except openai.RateLimitError:
+            self.token_limiter.penalize()
+            raise
+    
+    async def _ainvoke(self, prompt: str, max_output_tokens: int, batch: bool = False) -> str:
+        """
+        Send one prompt to the LLM (async)
+        
+        Args:
+            prompt: Prompt text
+            max_output_tokens: Expected response tokens for the token budget
+            batch: Use the batch response format system message
             
-            result = json.loads(content.strip())
-            return result
+        Returns:
+            Response text
+        """
+        # 요청 수와 예상 토큰이 모두 예산 안에 들어올 때까지 대기
+        system_tokens = _BATCH_SYSTEM_PROMPT_TOKENS if batch else _SYSTEM_PROMPT_TOKENS
+        await self.token_limiter.acquire(system_tokens + estimate_tokens(prompt) + max_output_tokens)
+        
+        try:
+            if settings.llm_streaming:
+                content = await self._astream_json(prompt, batch)
+            else:
+                messages = _chat_messages(prompt, batch)
+                content = (await self.llm.ainvoke(messages, extra_headers=_message_id_headers())).content
+        except openai.RateLimitError:
+            # 429: 버킷을 줄여 다른 동시 호출도 속도를 늦춤
+            self.token_limiter.penalize()
+            raise
+        return content
+    
+    def _stream_json(self, prompt: str) -> str:
+        """
+        Stream the LLM response and stop once a JSON object is complete
+        
+        JSON 뒤에 이어지는 설명 문장은 생성을 기다리지 않고 스트림을 닫아 버림.
+        LangChain의 stream()은 중간에 멈춰도 HTTP 응답을 닫지 않으므로
+        SDK 클라이언트를 직접 사용
+        
+        Args:
+            prompt: Prompt text
+            
+        Returns:
+            The first complete JSON object, or the whole response if none was found
+        """
+        scanner = _JsonObjectScanner()
+        stream = self.llm.client.create(**self._stream_params(prompt))
+        try:
+            for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                candidate = _first_json_object(scanner.feed(chunk.choices[0].delta.content))
+                if candidate is not None:
+                    return candidate
+        finally:
+            stream.close()
+        return scanner.text
+    
+    async def _astream_json(self, prompt: str, batch: bool = False) -> str:
+        """
+        Stream the LLM response and stop once a JSON object is complete (async)
+        
+        Args:
+            prompt: Prompt text
+            batch: Use the batch response format system message
+            
+        Returns:
+            The first complete JSON object, or the whole response if none was found
+        """
+        scanner = _JsonObjectScanner()
+        stream = await self.llm.async_client.create(**self._stream_params(prompt, batch))
+        try:
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                candidate = _first_json_object(scanner.feed(chunk.choices[0].delta.content))
+                if candidate is not None:
+                    return candidate
+        finally:
+            await stream.close()
+        return scanner.text
+    
+    def _stream_params(self, prompt: str, batch: bool = False) -> Dict[str, Any]:
+        """Chat completion request for a streamed call (same settings as self.llm)"""
+        return {
+            "model": self.llm.model_name,
+            "temperature": self.llm.temperature,
+            "messages": _chat_message_dicts(prompt, batch),
+            "stream": True,
+            "extra_headers": _message_id_headers(),
+            **self.llm.model_kwargs,
+        }
+    
+    def _cache_key(self, prompt: str, use_cache: Optional[bool]) -> Optional[str]:
+        """
+        Get response cache key for prompt
+        
+        Args:
+            prompt: Evaluation prompt
+            use_cache: Use the response cache (None: settings.llm_cache_enabled)
+            
+        Returns:
+            Cache key, or None if caching is disabled
+        """
+        if use_cache is None:
+            use_cache = settings.llm_cache_enabled
+        if not use_cache:
+            return None
+        # system 메시지(공통 지시문)가 바뀌면 키도 달라지도록 템플릿 해시를 포함
+        return llm_cache.make_key(self.llm.model_name, self.llm.temperature, _PROMPT_TEMPLATE_DIGEST + prompt)
+    
+    def _application_cache_key(
+        self,
+        application: Application,
+        criteria_list: Optional[List[EvaluationCriteria]],
+        department_info: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Get result cache key for application content
+        
+        프롬프트에 들어가는 항목 값, 프롬프트 틀, 평가 기준/등급 점수의 해시로 키를 만들어
+        내용이 같으면 프롬프트를 만들지 않고 저장된 결과를 사용
+        (항목 값은 공백/유니코드 표기 차이를 정리한 뒤 비교)
+        
+        Args:
+            application: Application to evaluate
+            criteria_list: Active evaluation criteria
+            department_info: Precomputed organization string (optional)
+            
+        Returns:
+            Cache key, or None if caching is disabled
+        """
+        if not settings.llm_cache_enabled:
+            return None
+        fields = {
+            field: _canonical_text(value)
+            for field, value in self._prompt_fields(application, department_info).items()
+        }
+        fingerprint = orjson.dumps(
+            {"template": _PROMPT_TEMPLATE_DIGEST, "criteria": _criteria_digest(criteria_list), "fields": fields},
+            option=orjson.OPT_SORT_KEYS
+        ).decode()
+        return self._cache_key(fingerprint, use_cache=True)
+    
+    def _parse_llm_response(self, content: str) -> Dict[str, Any]:
+        """
+        Parse JSON result from LLM response content
+        
+        Args:
+            content: LLM response text
+            
+        Returns:
+            Evaluation result dictionary
+            
+        Raises:
+            json.JSONDecodeError: If response is not valid JSON
+        """
+        # JSON 파싱 시도 (JSON 모드 응답은 첫 단계인 전체 파싱에서 바로 성공)
+        try:
+            return _extract_json_from_text(content)
         except json.JSONDecodeError as e:
-            print(f"❌ JSON parsing error: {e}")
-            print(f"Response content: {content}")
+            logger.warning("JSON parsing error: %s", e)
+            logger.debug("Response content: %s", content)
             raise
     
     def calculate_overall_grade(self, evaluation_detail: Dict[str, Any]) -> str:
@@ -211,35 +1082,23 @@ class LLMEvaluator:
         Returns:
             Overall grade (S/A/B/C/D)
         """
-        total_score = 0
-        count = 0
+        # 점수 항목만 한 번에 추출
+        scores = [
+            item["score"] for item in evaluation_detail.values()
+            if isinstance(item, dict) and "score" in item
+        ]
         
-        for item in evaluation_detail.values():
-            if isinstance(item, dict) and "score" in item:
-                total_score += item["score"]
-                count += 1
-        
-        if count == 0:
+        if not scores:
             return "C"
         
-        avg_score = total_score / count
-        
-        if avg_score >= 4.5:
-            return "S"
-        elif avg_score >= 3.5:
-            return "A"
-        elif avg_score >= 2.5:
-            return "B"
-        elif avg_score >= 1.5:
-            return "C"
-        else:
-            return "D"
+        return score_to_grade(sum(scores) / len(scores))
     
     def evaluate_application(
         self, 
         db: Session, 
         application: Application,
-        criteria_list: Optional[List[EvaluationCriteria]] = None
+        criteria_list: Optional[List[EvaluationCriteria]] = None,
+        force: bool = False
     ) -> bool:
         """
         Evaluate single application
@@ -248,6 +1107,7 @@ class LLMEvaluator:
             db: Database session
             application: Application to evaluate
             criteria_list: Evaluation criteria (optional, will fetch if None)
+            force: Skip the cached result and call the LLM (new result is cached)
             
         Returns:
             True if successful, False otherwise
@@ -255,98 +1115,507 @@ class LLMEvaluator:
         try:
             # Get evaluation criteria if not provided (backward compatibility)
             if criteria_list is None:
-                criteria_list = db.query(EvaluationCriteria).filter(
-                    EvaluationCriteria.is_active == True
-                ).order_by(EvaluationCriteria.display_order).all()
-            
-            # Build prompt
-            prompt = self.build_evaluation_prompt(application, criteria_list or [])
-            
-            # Evaluate with LLM
-            print(f"🤖 Evaluating application {application.id} ({application.subject})...")
-            result = self.evaluate_with_llm(prompt)
-            
-            # Extract simplified format results
-            ai_category = result.get("ai_category", "분류")
-            business_impact = result.get("business_impact", "")
-            technical_feasibility = result.get("technical_feasibility", "")
-            five_line_summary = result.get("five_line_summary", [])
-            
-            # Build AI categories for compatibility
-            ai_categories = [{
-                "category": ai_category,
-                "description": "지원서 기반 AI 요약"
-            }]
-            
-            # Build evaluation detail - simplified 4-item format
-            evaluation_detail = {
-                "ai_category": ai_category,
-                "business_impact": business_impact,
-                "technical_feasibility": technical_feasibility,
-                "five_line_summary": five_line_summary
-            }
+                criteria_list = self.get_active_criteria(db)
             
-            # Simple grade based on feasibility tone
-            if "어렵" in technical_feasibility or "불가능" in technical_feasibility:
-                overall_grade = "C"
-            elif "가능" in technical_feasibility and "충분" in technical_feasibility:
-                overall_grade = "A"
+            # 내용이 같은 지원서의 이전 결과가 있으면 LLM 호출 생략
+            # 조직 정보는 캐시 키와 프롬프트에서 함께 사용하므로 한 번만 계산
+            department_info = _department_info(application)
+            cache_key = self._application_cache_key(application, criteria_list, department_info)
+            cached = llm_cache.get(cache_key) if cache_key and not force else None
+            if cached is not None:
+                logger.info("Using cached evaluation for application %s", application.id)
+                result = orjson.loads(cached)
             else:
-                overall_grade = "B"
-            
-            # Build summary
-            summary_parts = []
-            summary_parts.append(f"**AI 기술 분류**: {ai_category}\n\n")
-            summary_parts.append(f"**조직 관점의 경영효과**\n{business_impact}\n\n")
-            summary_parts.append(f"**AI 관점의 구현 가능성**\n{technical_feasibility}\n\n")
-            summary_parts.append(f"**전체 지원서 5줄 요약**\n" + "\n".join(five_line_summary))
-            
-            summary = "".join(summary_parts)
-            
-            # Update application
-            application.ai_categories = ai_categories
-            application.ai_category_primary = ai_category
-            application.ai_evaluation_detail = evaluation_detail
-            application.ai_grade = overall_grade
-            application.ai_summary = summary
-            application.ai_evaluated_at = datetime.utcnow()
-            application.status = "ai_evaluated"
-            
-            # Save evaluation history
-            history = EvaluationHistory(
-                application_id=application.id,
-                evaluator_id=None,
-                evaluator_type="AI",
-                grade=overall_grade,
-                summary=summary,
-                evaluation_detail=evaluation_detail,
-                ai_categories=ai_categories
-            )
-            db.add(history)
+                # Build prompt
+                prompt = self.build_evaluation_prompt(
+                    application, criteria_list or [], department_info=department_info
+                )
+                
+                # Evaluate with LLM
+                logger.info("Evaluating application %s (%s)...", application.id, application.subject)
+                result = self.evaluate_with_llm(prompt, use_cache=False)
             
-            db.commit()
-            print(f"✅ Application {application.id} evaluated: {overall_grade} ({ai_category})")
+            overall_grade, ai_category = self._store_evaluation(db, application, result)
+            # 형식 검증을 통과해 반영된 결과만 캐시
+            if cache_key and cached is None:
+                llm_cache.set(cache_key, orjson.dumps(result).decode())
+            
+            logger.info("Application %s evaluated: %s (%s)", application.id, overall_grade, ai_category)
             return True
             
         except Exception as e:
-            print(f"❌ Error evaluating application {application.id}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error evaluating application %s: %s", application.id, e)
             db.rollback()
             return False
     
-    def _score_to_grade(self, score: float) -> str:
-        """Convert numeric score to letter grade"""
-        if score >= 4.5:
-            return "S"
-        elif score >= 3.5:
-            return "A"
-        elif score >= 2.5:
-            return "B"
-        elif score >= 1.5:
-            return "C"
+    async def aevaluate_application(
+        self,
+        db: Session,
+        application: Application,
+        criteria_list: Optional[List[EvaluationCriteria]] = None,
+        commit: bool = True,
+        force: bool = False
+    ) -> bool:
+        """
+        Evaluate single application (async)
+        
+        Args:
+            db: Database session
+            application: Application to evaluate
+            criteria_list: Evaluation criteria (optional, will fetch if None)
+            commit: Commit the result (False: stage in a SAVEPOINT, caller commits)
+            force: Skip the cached result and call the LLM (new result is cached)
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        success, _ = await self._aevaluate_application(db, application, criteria_list, commit, force)
+        return success
+    
+    async def _aevaluate_application(
+        self,
+        db: Session,
+        application: Application,
+        criteria_list: Optional[List[EvaluationCriteria]] = None,
+        commit: bool = True,
+        force: bool = False,
+        db_lock: Optional[asyncio.Lock] = None,
+        on_stored: Optional[Callable[[int], None]] = None
+    ) -> Tuple[bool, Optional[str]]:
+        """
+        Evaluate single application and report why it failed (async)
+        
+        Args:
+            db: Database session
+            application: Application to evaluate
+            criteria_list: Evaluation criteria (optional, will fetch if None)
+            commit: Commit the result (False: stage in a SAVEPOINT, caller commits)
+            force: Skip the cached result and call the LLM (new result is cached)
+            db_lock: Lock held while using the session (shared with the caller's commits in a thread)
+            on_stored: Called with the application id once the result is staged in the session
+            
+        Returns:
+            (success, error message or None)
+        """
+        try:
+            if criteria_list is None:
+                criteria_list = self.get_active_criteria(db)
+            
+            # 지원서 속성 조회(지연 로딩 포함)가 스레드에서 진행 중인 커밋과 겹치지 않도록 잠금
+            async with db_lock or nullcontext():
+                # 조직 정보는 캐시 키와 프롬프트에서 함께 사용하므로 한 번만 계산
+                department_info = _department_info(application)
+                cache_key = self._application_cache_key(application, criteria_list, department_info)
+                cached = llm_cache.get(cache_key) if cache_key and not force else None
+                if cached is None:
+                    prompt = self.build_evaluation_prompt(
+                        application, criteria_list or [], department_info=department_info
+                    )
+            
+            if cached is not None:
+                logger.info("Using cached evaluation for application %s", application.id)
+                result = orjson.loads(cached)
+            else:
+                logger.info("Evaluating application %s (%s)...", application.id, application.subject)
+                result = await self.aevaluate_with_llm(prompt, use_cache=False)
+            
+            # DB 반영 구간에는 await가 없으므로 세션을 공유해도 동시에 실행되지 않음
+            async with db_lock or nullcontext():
+                overall_grade, ai_category = self._store_evaluation(db, application, result, commit)
+                if on_stored:
+                    on_stored(application.id)
+            if cache_key and cached is None:
+                llm_cache.set(cache_key, orjson.dumps(result).decode())
+            
+            logger.info("Application %s evaluated: %s (%s)", application.id, overall_grade, ai_category)
+            return True, None
+            
+        except Exception as e:
+            logger.exception("Error evaluating application %s: %s", application.id, e)
+            # 일괄 평가 중에는 다른 지원서의 반영분까지 되돌리지 않음 (SAVEPOINT가 처리)
+            if commit:
+                db.rollback()
+            return False, str(e)
+    
+    async def aevaluate_applications(
+        self,
+        db: Session,
+        applications: List[Application],
+        criteria_list: Optional[List[EvaluationCriteria]] = None,
+        commit_every: Optional[int] = None
+    ) -> Dict[int, Tuple[bool, Optional[str]]]:
+        """
+        Evaluate many applications concurrently
+        
+        동시 LLM 호출 수는 settings.llm_max_concurrency로 제한.
+        지원서별 결과는 SAVEPOINT로 반영하고 commit_every건마다, 그리고 마지막에 커밋.
+        커밋이 실패하면 그 커밋에 포함된 지원서만 실패로 보고하고 나머지 평가는 계속
+        (이전 커밋으로 저장된 결과는 유지)
+        
+        Args:
+            db: Database session
+            applications: Applications to evaluate
+            criteria_list: Evaluation criteria (optional, will fetch if None)
+            commit_every: Commit after this many staged results (None: settings.llm_commit_every, 0: only at the end)
+            
+        Returns:
+            {application_id: (success, error message or None)}
+        """
+        if criteria_list is None:
+            criteria_list = self.get_active_criteria(db)
+        if commit_every is None:
+            commit_every = settings.llm_commit_every
+        
+        semaphore = asyncio.Semaphore(settings.llm_max_concurrency)
+        # 중간 커밋은 스레드에서 수행하므로, 커밋 중에는 다른 코루틴이 세션을 쓰지 않도록 잠금
+        db_lock = asyncio.Lock()
+        results: Dict[int, Tuple[bool, Optional[str]]] = {}
+        # 세션에 반영했지만 아직 커밋하지 않은 지원서 (반영 시점에 잠금 안에서 기록)
+        uncommitted: List[int] = []
+        
+        async def commit_staged():
+            # 커밋(fsync)은 스레드에서 수행하고, 실패하면 커밋되지 않은 지원서를 실패로 기록
+            async with db_lock:
+                committing = uncommitted[:]
+                uncommitted.clear()
+                try:
+                    await asyncio.to_thread(_commit_keep_loaded, db)
+                except Exception as e:
+                    logger.exception("Failed to commit %d evaluation results: %s", len(committing), e)
+                    db.rollback()
+                    for application_id in committing:
+                        results[application_id] = (False, f"Commit failed: {e}")
+        
+        async def staged(staged_results: Dict[int, Tuple[bool, Optional[str]]]):
+            # 보고 전에 커밋 실패로 기록된 지원서는 실패 결과를 유지
+            for application_id, result in staged_results.items():
+                results.setdefault(application_id, result)
+            if commit_every and len(uncommitted) >= commit_every:
+                await commit_staged()
+        
+        batch_size = settings.llm_batch_prompt_size
+        if batch_size > 1:
+            # 배치 프롬프트: 지원서 batch_size건당 LLM 호출 1회
+            async def evaluate_batch(batch: List[Application]):
+                async with semaphore:
+                    await staged(await self.aevaluate_application_batch(
+                        db, batch, criteria_list, db_lock, on_stored=uncommitted.append
+                    ))
+            
+            batches = [applications[i:i + batch_size] for i in range(0, len(applications), batch_size)]
+            await asyncio.gather(*(evaluate_batch(batch) for batch in batches))
+        else:
+            async def evaluate(application: Application):
+                async with semaphore:
+                    result = await self._aevaluate_application(
+                        db, application, criteria_list, commit=False, db_lock=db_lock, on_stored=uncommitted.append
+                    )
+                    await staged({application.id: result})
+            
+            await asyncio.gather(*(evaluate(application) for application in applications))
+        
+        # 모든 평가가 끝나 세션을 쓰는 코루틴이 없으므로 마지막 커밋도 스레드에서 수행
+        # (호출자가 함께 반영한 변경도 이 커밋에 포함됨)
+        await commit_staged()
+        return {application.id: results[application.id] for application in applications}
+    
+    async def aevaluate_application_batch(
+        self,
+        db: Session,
+        applications: List[Application],
+        criteria_list: List[EvaluationCriteria],
+        db_lock: Optional[asyncio.Lock] = None,
+        on_stored: Optional[Callable[[int], None]] = None
+    ) -> Dict[int, Tuple[bool, Optional[str]]]:
+        """
+        Evaluate several applications with a single LLM request
+        
+        배치 응답을 해석할 수 없으면 지원서별 단건 평가로 대체하고,
+        형식 검증에 실패한 항목만 단건으로 다시 평가.
+        배치 응답 자체는 캐시하지 않고, 반영된 항목만 지원서 단위 캐시에 저장
+        (이후 단건 평가에서도 재사용). 결과는 SAVEPOINT로만 반영하므로 커밋은 호출자가 수행
+        
+        Args:
+            db: Database session
+            applications: Applications to evaluate
+            criteria_list: Evaluation criteria
+            db_lock: Lock held while using the session (shared with the caller's commits in a thread)
+            on_stored: Called with each application id once its result is staged in the session
+            
+        Returns:
+            {application_id: (success, error message or None)}
+        """
+        async def evaluate_single(application: Application) -> Tuple[bool, Optional[str]]:
+            return await self._aevaluate_application(
+                db, application, criteria_list, commit=False, db_lock=db_lock, on_stored=on_stored
+            )
+        
+        if len(applications) == 1:
+            application = applications[0]
+            return {application.id: await evaluate_single(application)}
+        
+        try:
+            async with db_lock or nullcontext():
+                prompt = self.build_batch_evaluation_prompt(applications, criteria_list)
+            logger.info("Evaluating %d applications in one request...", len(applications))
+            # 개수/형식 검증 전의 배치 응답이 캐시되면 매번 같은 실패를 반복하므로 캐시 사용 안 함
+            result = await self.aevaluate_with_llm(
+                prompt, use_cache=False, max_output_tokens=_MAX_OUTPUT_TOKENS * len(applications), batch=True
+            )
+            items = result.get("results")
+            if not isinstance(items, list) or len(items) != len(applications):
+                raise ValueError(f"expected {len(applications)} results in batch response")
+        except Exception as e:
+            logger.warning("Batch evaluation failed, falling back to single requests: %s", e)
+            return {application.id: await evaluate_single(application) for application in applications}
+        
+        results = {}
+        retry_single = []
+        async with db_lock or nullcontext():
+            for application, item in zip(applications, items):
+                try:
+                    overall_grade, ai_category = self._store_evaluation(db, application, item, commit=False)
+                except Exception as e:
+                    logger.warning("Invalid batch result for application %s, retrying alone: %s", application.id, e)
+                    retry_single.append(application)
+                    continue
+                if on_stored:
+                    on_stored(application.id)
+                logger.info("Application %s evaluated: %s (%s)", application.id, overall_grade, ai_category)
+                results[application.id] = (True, None)
+                cache_key = self._application_cache_key(application, criteria_list)
+                if cache_key:
+                    llm_cache.set(cache_key, orjson.dumps(item).decode())
+        
+        for application in retry_single:
+            results[application.id] = await evaluate_single(application)
+        return {application.id: results[application.id] for application in applications}
+    
+    def submit_batch_evaluation(
+        self,
+        db: Session,
+        applications: List[Application],
+        criteria_list: Optional[List[EvaluationCriteria]] = None
+    ) -> str:
+        """
+        Submit applications to the OpenAI Batch API (returns without waiting)
+        
+        실시간 RPM 한도와 무관하게 처리되며 (완료까지 최대 24시간),
+        야간 일괄 평가처럼 결과를 바로 기다리지 않아도 되는 경우에 사용.
+        결과는 collect_batch_evaluation으로 가져옴 (batch_evaluate.py 참고).
+        LLM 서버가 /v1/batches를 지원해야 함.
+        
+        Args:
+            db: Database session
+            applications: Applications to evaluate
+            criteria_list: Evaluation criteria (optional, will fetch if None)
+            
+        Returns:
+            Batch id
+        """
+        if criteria_list is None:
+            criteria_list = self.get_active_criteria(db)
+        
+        # 요청 1건 = JSONL 1줄 (custom_id로 결과와 지원서를 매칭)
+        # 실시간 호출과 같은 설정 + 응답 길이 상한
+        lines = []
+        for application in applications:
+            body = {
+                "model": self.llm.model_name,
+                "temperature": self.llm.temperature,
+                "max_tokens": _MAX_OUTPUT_TOKENS,
+                "messages": _chat_message_dicts(self.build_evaluation_prompt(application, criteria_list or [])),
+                **self.llm.model_kwargs,
+            }
+            lines.append(orjson.dumps({
+                "custom_id": str(application.id),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": body,
+            }))
+        
+        # openai 1.10 SDK에는 batches 리소스가 없어 REST 엔드포인트를 직접 호출
+        # (메시지 ID 헤더는 요청마다 새로 발급)
+        input_file = self.openai_client.files.create(
+            file=("evaluation_batch.jsonl", b"\n".join(lines)),
+            purpose="batch",
+            extra_headers=_message_id_headers()
+        )
+        batch = self.openai_client.post(
+            "/batches",
+            body={
+                "input_file_id": input_file.id,
+                "endpoint": "/v1/chat/completions",
+                "completion_window": "24h",
+            },
+            cast_to=httpx.Response,
+            options={"headers": _message_id_headers()}
+        ).json()
+        logger.info("Submitted evaluation batch %s (%d applications)", batch["id"], len(applications))
+        return batch["id"]
+    
+    def collect_batch_evaluation(self, db: Session, batch_id: str) -> Optional[Dict[int, bool]]:
+        """
+        Store the results of a submitted evaluation batch if it has finished
+        
+        상태를 한 번만 조회하고 바로 반환하므로 대기/타임아웃은 호출 측에서 결정.
+        
+        Args:
+            db: Database session
+            batch_id: Id returned by submit_batch_evaluation
+            
+        Returns:
+            {application_id: success} for the applications in the batch,
+            or None if the batch is still running
+        """
+        batch = self.openai_client.get(
+            f"/batches/{batch_id}",
+            cast_to=httpx.Response,
+            options={"headers": _message_id_headers()}
+        ).json()
+        if batch["status"] not in ("completed", "failed", "expired", "cancelled"):
+            return None
+        if batch["status"] != "completed" or not batch.get("output_file_id"):
+            logger.error("Evaluation batch %s ended with status %s", batch_id, batch["status"])
+            return {}
+        
+        output = self.openai_client.files.content(
+            batch["output_file_id"],
+            extra_headers=_message_id_headers()
+        ).text
+        items = [orjson.loads(line) for line in output.splitlines() if line.strip()]
+        application_ids = [int(item["custom_id"]) for item in items if str(item.get("custom_id", "")).isdigit()]
+        applications_by_id = {
+            str(application.id): application
+            for application in db.query(Application).filter(Application.id.in_(application_ids))
+        }
+        
+        results = {}
+        for item in items:
+            application = applications_by_id.get(item.get("custom_id"))
+            if application is None:
+                continue
+            try:
+                content = item["response"]["body"]["choices"][0]["message"]["content"]
+                result = self._parse_llm_response(content)
+                overall_grade, ai_category = self._store_evaluation(db, application, result, commit=False)
+                logger.info("Application %s evaluated: %s (%s)", application.id, overall_grade, ai_category)
+                results[application.id] = True
+            except Exception as e:
+                logger.exception("Error evaluating application %s: %s", application.id, e)
+                results[application.id] = False
+        # 전체 결과를 한 트랜잭션으로 커밋
+        db.commit()
+        return results
+    
+    def _apply_evaluation(
+        self,
+        db: Session,
+        application: Application,
+        result: Dict[str, Any]
+    ) -> Tuple[str, str]:
+        """
+        Stage LLM evaluation result on application (no commit)
+        
+        Args:
+            db: Database session
+            application: Evaluated application
+            result: Parsed LLM result
+            
+        Returns:
+            (overall_grade, ai_category)
+            
+        Raises:
+            pydantic.ValidationError: If the result does not match the response format
+        """
+        # 응답 형식 검증 (타입이 다르면 반영하지 않음, 누락 항목은 기본값)
+        evaluation = AIEvaluationResult.model_validate(result)
+        ai_category = evaluation.ai_category
+        business_impact = evaluation.business_impact
+        technical_feasibility = evaluation.technical_feasibility
+        five_line_summary = evaluation.five_line_summary
+        
+        # Build AI categories for compatibility
+        ai_categories = [{
+            "category": ai_category,
+            "description": "지원서 기반 AI 요약"
+        }]
+        
+        # Build evaluation detail - simplified 4-item format
+        evaluation_detail = {
+            "ai_category": ai_category,
+            "business_impact": business_impact,
+            "technical_feasibility": technical_feasibility,
+            "five_line_summary": five_line_summary
+        }
+        
+        # Simple grade based on feasibility tone
+        if "어렵" in technical_feasibility or "불가능" in technical_feasibility:
+            overall_grade = "C"
+        elif "가능" in technical_feasibility and "충분" in technical_feasibility:
+            overall_grade = "A"
         else:
-            return "D"
+            overall_grade = "B"
+        
+        # Build summary
+        summary = "\n\n".join((
+            f"**AI 기술 분류**: {ai_category}",
+            f"**조직 관점의 경영효과**\n{business_impact}",
+            f"**AI 관점의 구현 가능성**\n{technical_feasibility}",
+            "**전체 지원서 5줄 요약**\n" + "\n".join(five_line_summary),
+        ))
+        
+        # Update application
+        application.ai_categories = ai_categories
+        application.ai_category_primary = ai_category
+        application.ai_evaluation_detail = evaluation_detail
+        application.ai_grade = overall_grade
+        application.ai_summary = summary
+        application.ai_evaluated_at = datetime.utcnow()
+        application.status = "ai_evaluated"
+        
+        # Save evaluation history
+        history = EvaluationHistory(
+            application_id=application.id,
+            evaluator_id=None,
+            evaluator_type="AI",
+            grade=overall_grade,
+            summary=summary,
+            evaluation_detail=evaluation_detail,
+            ai_categories=ai_categories
+        )
+        db.add(history)
+        
+        return overall_grade, ai_category
+    
+    def _store_evaluation(
+        self,
+        db: Session,
+        application: Application,
+        result: Dict[str, Any],
+        commit: bool = True
+    ) -> Tuple[str, str]:
+        """
+        Apply LLM evaluation result and commit it, or stage it for a batch commit
+        
+        commit=False이면 지원서별 SAVEPOINT 안에서 반영하여 실패한 건만 되돌리고,
+        커밋은 호출자가 모든 결과를 모은 뒤 한 번에 수행
+        
+        Args:
+            db: Database session
+            application: Evaluated application
+            result: Parsed LLM result
+            commit: Commit immediately
+            
+        Returns:
+            (overall_grade, ai_category)
+        """
+        if commit:
+            staged = self._apply_evaluation(db, application, result)
+            db.commit()
+            return staged
+        with db.begin_nested():
+            return self._apply_evaluation(db, application, result)
 
 
 # Singleton instance
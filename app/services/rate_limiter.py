@@ -3,9 +3,15 @@ Rate Limiter Service
 Provides rate limiting functionality for API calls
 """
 import time
+import asyncio
+import logging
+import weakref
+import threading
 from collections import deque
 from datetime import datetime, timedelta
 
+logger = logging.getLogger(__name__)
+
 
 class RateLimiter:
     """
@@ -30,6 +36,10 @@ class RateLimiter:
         self.max_calls = max_calls
         self.time_window = time_window
         self.calls = deque()
+        # 서버가 429로 요청한 대기 종료 시각
+        self.blocked_until = None
+        # 여러 스레드가 같은 limiter를 공유할 수 있도록 보호
+        self.lock = threading.Lock()
     
     def wait_if_needed(self):
         """
@@ -38,9 +48,30 @@ class RateLimiter:
         This method uses a sliding window algorithm to track API calls.
         If the rate limit is reached, it automatically waits until the
         oldest call expires from the time window.
+        Thread-safe: the window is checked and updated under an internal lock,
+        but the wait itself happens outside it, so penalize() is never delayed.
+        """
+        while True:
+            with self.lock:
+                wait_time = self._try_record()
+            if not wait_time:
+                return
+            # 대기 후 다시 확인 (그 사이 다른 스레드가 자리를 가져갔거나 penalize됐을 수 있음)
+            time.sleep(wait_time)
+    
+    def _try_record(self) -> float:
+        """
+        Record a call if the window allows it (caller holds the lock)
+        
+        Returns:
+            0 if recorded, otherwise seconds to wait before trying again
         """
         now = datetime.now()
         
+        # Honor server-requested backoff (see penalize)
+        if self.blocked_until and self.blocked_until > now:
+            return (self.blocked_until - now).total_seconds()
+        
         # Remove calls outside the time window
         while self.calls and self.calls[0] < now - timedelta(seconds=self.time_window):
             self.calls.popleft()
@@ -49,19 +80,37 @@ class RateLimiter:
         if len(self.calls) >= self.max_calls:
             sleep_time = (self.calls[0] + timedelta(seconds=self.time_window) - now).total_seconds()
             if sleep_time > 0:
-                print(f"⏳ Rate limit reached ({self.max_calls} calls/{self.time_window}s). Waiting {sleep_time:.1f} seconds...")
-                time.sleep(sleep_time + 0.1)  # Add 0.1s buffer
-                # Clean up expired calls after waiting
-                now = datetime.now()
-                while self.calls and self.calls[0] < now - timedelta(seconds=self.time_window):
-                    self.calls.popleft()
+                logger.info(
+                    "Rate limit reached (%d calls/%ss). Waiting %.1f seconds...",
+                    self.max_calls, self.time_window, sleep_time
+                )
+                return sleep_time + 0.1  # Add 0.1s buffer
         
         # Record this call
-        self.calls.append(datetime.now())
+        self.calls.append(now)
+        return 0.0
+    
+    def penalize(self, seconds: float):
+        """
+        Block all calls for the given duration
+        
+        Call this when the server answers 429 so that every caller sharing
+        this limiter backs off, not only the one that was rejected.
+        
+        Args:
+            seconds: Seconds to wait before the next call is allowed
+        """
+        until = datetime.now() + timedelta(seconds=seconds)
+        # 비교와 갱신 사이에 다른 스레드가 더 긴 대기를 기록해도 덮어쓰지 않도록 잠금
+        with self.lock:
+            if not self.blocked_until or until > self.blocked_until:
+                self.blocked_until = until
     
     def reset(self):
         """Reset the rate limiter, clearing all call history"""
-        self.calls.clear()
+        with self.lock:
+            self.calls.clear()
+            self.blocked_until = None
     
     def get_remaining_calls(self) -> int:
         """
@@ -91,9 +140,149 @@ class RateLimiter:
         while self.calls and self.calls[0] < now - timedelta(seconds=self.time_window):
             self.calls.popleft()
         
+        blocked_time = (self.blocked_until - now).total_seconds() if self.blocked_until else 0.0
+        
         if len(self.calls) < self.max_calls:
-            return 0.0
+            return max(0.0, blocked_time)
         
         # Calculate wait time until oldest call expires
         wait_time = (self.calls[0] + timedelta(seconds=self.time_window) - now).total_seconds()
-        return max(0.0, wait_time)
+        return max(0.0, wait_time, blocked_time)
+
+
+class TokenBucketLimiter:
+    """
+    Async rate limiter with request and token buckets (RPM/TPM budget)
+    
+    Both buckets refill continuously. A call waits until it can take one
+    request and its estimated token cost, so bursts stay under the provider
+    limits instead of being rejected with 429.
+    Sync callers (threads) and async callers draw from the same budget.
+    
+    Usage:
+        limiter = TokenBucketLimiter(requests_per_minute=20, tokens_per_minute=100000)
+        
+        # Before each API call
+        await limiter.acquire(token_count)   # async
+        limiter.wait(token_count)            # sync
+        # Make API call here
+    """
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        """
+        Initialize token bucket limiter
+        
+        Args:
+            requests_per_minute: Request budget per minute
+            tokens_per_minute: Token budget per minute
+        """
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.available_requests = float(requests_per_minute)
+        self.available_tokens = float(tokens_per_minute)
+        self.last_update = time.monotonic()
+        # 대기 중인 async 호출이 순서대로 용량을 가져가도록 보호
+        # (asyncio.Lock은 처음 사용한 이벤트 루프에 묶이므로 루프별로 사용 시점에 생성)
+        self._async_locks = weakref.WeakKeyDictionary()  # {event loop: asyncio.Lock}
+        # 버킷 상태 보호 (스레드와 이벤트 루프가 함께 사용)
+        self.state_lock = threading.Lock()
+    
+    def _refill(self):
+        """Add capacity for the time elapsed since the last update"""
+        now = time.monotonic()
+        elapsed = now - self.last_update
+        self.last_update = now
+        self.available_requests = min(
+            float(self.requests_per_minute),
+            self.available_requests + self.requests_per_minute * elapsed / 60
+        )
+        self.available_tokens = min(
+            float(self.tokens_per_minute),
+            self.available_tokens + self.tokens_per_minute * elapsed / 60
+        )
+    
+    def _try_take(self, token_count: int) -> float:
+        """
+        Take capacity if available
+        
+        Args:
+            token_count: Tokens to take (already capped to the bucket size)
+            
+        Returns:
+            0 if taken, otherwise seconds until enough capacity refills
+        """
+        with self.state_lock:
+            self._refill()
+            if self.available_requests >= 1 and self.available_tokens >= token_count:
+                self.available_requests -= 1
+                self.available_tokens -= token_count
+                return 0.0
+            
+            # 부족한 용량이 채워질 때까지 걸리는 시간
+            return max(
+                (1 - self.available_requests) * 60 / self.requests_per_minute,
+                (token_count - self.available_tokens) * 60 / self.tokens_per_minute,
+                0.001
+            )
+    
+    def _async_lock(self) -> asyncio.Lock:
+        """Lock for async callers on the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self.state_lock:
+            lock = self._async_locks.get(loop)
+            if lock is None:
+                lock = self._async_locks[loop] = asyncio.Lock()
+            return lock
+    
+    async def acquire(self, token_count: int = 0):
+        """
+        Wait until one request and token_count tokens are available
+        
+        Args:
+            token_count: Estimated tokens of the call (prompt + completion)
+        """
+        # 한 번에 채울 수 없는 큰 요청은 버킷 전체만큼만 요구
+        token_count = min(token_count, self.tokens_per_minute)
+        
+        async with self._async_lock():
+            while True:
+                wait_time = self._try_take(token_count)
+                if not wait_time:
+                    return
+                await asyncio.sleep(wait_time)
+    
+    def wait(self, token_count: int = 0):
+        """
+        Block until one request and token_count tokens are available (sync)
+        
+        Args:
+            token_count: Estimated tokens of the call (prompt + completion)
+        """
+        token_count = min(token_count, self.tokens_per_minute)
+        while True:
+            wait_time = self._try_take(token_count)
+            if not wait_time:
+                return
+            time.sleep(wait_time)
+    
+    def penalize(self, ratio: float = 0.1):
+        """
+        Drain part of both buckets after the server answered 429
+        
+        Buckets go negative so that callers wait for the debt to refill, but
+        never below one minute of budget: repeated 429s delay the next call
+        by at most about a minute.
+        
+        Args:
+            ratio: Fraction of the per-minute budget to remove
+        """
+        with self.state_lock:
+            self._refill()
+            self.available_requests = max(
+                self.available_requests - self.requests_per_minute * ratio,
+                -float(self.requests_per_minute)
+            )
+            self.available_tokens = max(
+                self.available_tokens - self.tokens_per_minute * ratio,
+                -float(self.tokens_per_minute)
+            )
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from app.models.application import Application
 from app.models.department import Department
 from app.models.category import AICategory
+from app.services.grading import GRADE_SCORES, score_to_grade
 
 
 class StatisticsService:
@@ -32,10 +33,9 @@ class StatisticsService:
         user_evaluated = query.filter(Application.user_grade.isnot(None)).count()
         
         # Calculate average AI grade
-        grade_mapping = {"S": 5, "A": 4, "B": 3, "C": 2, "D": 1}
         ai_grades = [app.ai_grade for app in query.filter(Application.ai_grade.isnot(None)).all()]
-        avg_ai_grade = sum(grade_mapping.get(g, 0) for g in ai_grades) / len(ai_grades) if ai_grades else 0
-        avg_ai_grade_letter = self._score_to_grade(avg_ai_grade)
+        avg_ai_grade = sum(GRADE_SCORES.get(g, 0) for g in ai_grades) / len(ai_grades) if ai_grades else 0
+        avg_ai_grade_letter = score_to_grade(avg_ai_grade)
         
         return {
             "total_applications": total_applications,
@@ -213,23 +213,9 @@ class StatisticsService:
     
     def _calculate_avg_grade(self, grades: List[str]) -> str:
         """Calculate average grade"""
-        grade_mapping = {"S": 5, "A": 4, "B": 3, "C": 2, "D": 1}
-        scores = [grade_mapping.get(g, 0) for g in grades if g]
+        scores = [GRADE_SCORES.get(g, 0) for g in grades if g]
         avg_score = sum(scores) / len(scores) if scores else 0
-        return self._score_to_grade(avg_score)
-    
-    def _score_to_grade(self, score: float) -> str:
-        """Convert score to grade"""
-        if score >= 4.5:
-            return "S"
-        elif score >= 3.5:
-            return "A"
-        elif score >= 2.5:
-            return "B"
-        elif score >= 1.5:
-            return "C"
-        else:
-            return "D"
+        return score_to_grade(avg_score)
     
     def _compare_grades(self, applications: List[Application]) -> List[Dict[str, int]]:
         """Compare AI vs User grades"""
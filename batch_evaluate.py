@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Offline Batch Evaluation Script
+미평가 지원서를 OpenAI Batch API로 제출하고, 완료된 배치의 결과를 저장합니다.
+
+    python batch_evaluate.py submit [--ids 1 2 3]
+    python batch_evaluate.py collect <batch_id> [--wait --timeout 3600]
+"""
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Add app directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+def submit(db, application_ids=None) -> int:
+    """Submit pending (or the given) applications and print the batch id"""
+    from sqlalchemy.orm import joinedload
+    from app.models.application import Application
+    from app.services.llm_evaluator import llm_evaluator
+    
+    if application_ids:
+        query = db.query(Application).filter(Application.id.in_(application_ids))
+    else:
+        query = db.query(Application).filter(Application.ai_grade.is_(None))
+    applications = query.options(joinedload(Application.department)).all()
+    if not applications:
+        print("No applications to evaluate")
+        return 0
+    
+    batch_id = llm_evaluator.submit_batch_evaluation(db, applications)
+    print(f"Submitted batch {batch_id} ({len(applications)} applications)")
+    print(f"Collect with: python batch_evaluate.py collect {batch_id} --wait")
+    return 0
+
+
+def collect(db, batch_id: str, wait: bool = False, timeout: float = 3600.0, poll_interval: float = 60.0) -> int:
+    """
+    Store the results of a finished batch
+    
+    Args:
+        db: Database session
+        batch_id: Batch id printed by submit
+        wait: Poll until the batch finishes
+        timeout: Seconds to wait before giving up (with wait)
+        poll_interval: Seconds between status checks (with wait)
+    
+    Returns:
+        Exit code (0: stored, 1: failed, 2: still running)
+    """
+    from app.services.llm_evaluator import llm_evaluator
+    
+    deadline = time.monotonic() + timeout
+    while True:
+        results = llm_evaluator.collect_batch_evaluation(db, batch_id)
+        if results is not None:
+            break
+        if not wait or time.monotonic() + poll_interval > deadline:
+            # 배치는 서버에서 계속 진행되므로 나중에 다시 collect하면 됨
+            print(f"Batch {batch_id} is still running")
+            return 2
+        time.sleep(poll_interval)
+    
+    if not results:
+        print(f"Batch {batch_id} produced no results")
+        return 1
+    success_count = sum(results.values())
+    print(f"Stored {success_count}/{len(results)} evaluations from batch {batch_id}")
+    return 0 if success_count == len(results) else 1
+
+
+def main(argv=None) -> int:
+    """Submit or collect an offline evaluation batch"""
+    parser = argparse.ArgumentParser(description="Offline batch evaluation (OpenAI Batch API)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    submit_parser = subparsers.add_parser("submit", help="Submit pending applications")
+    submit_parser.add_argument("--ids", type=int, nargs="+", help="Application ids (default: all pending)")
+    
+    collect_parser = subparsers.add_parser("collect", help="Store results of a finished batch")
+    collect_parser.add_argument("batch_id")
+    collect_parser.add_argument("--wait", action="store_true", help="Poll until the batch finishes")
+    collect_parser.add_argument("--timeout", type=float, default=3600.0, help="Seconds to wait (default: 3600)")
+    collect_parser.add_argument("--poll-interval", type=float, default=60.0, help="Seconds between checks")
+    args = parser.parse_args(argv)
+    
+    from app.database import SessionLocal
+    db = SessionLocal()
+    try:
+        if args.command == "submit":
+            return submit(db, args.ids)
+        return collect(db, args.batch_id, args.wait, args.timeout, args.poll_interval)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Batch Evaluation Test Script
+Tests offline evaluation through the Batch API with a fake OpenAI client
+"""
+import json
+from types import SimpleNamespace
+import httpx
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+import batch_evaluate
+from app.database import Base
+from app.models import Application, EvaluationHistory
+from app.services.llm_evaluator import llm_evaluator
+
+
+class FakeOpenAI:
+    """Records Batch API calls and answers them from self.batch / self.output"""
+    
+    def __init__(self):
+        self.uploads = []
+        self.requests = []
+        self.batch = {"id": "batch_1", "status": "in_progress"}
+        self.output = ""
+        self.files = SimpleNamespace(create=self._create_file, content=self._file_content)
+    
+    def _create_file(self, file, purpose, extra_headers=None):
+        self.uploads.append((file, purpose, extra_headers))
+        return SimpleNamespace(id="file_in")
+    
+    def _file_content(self, file_id, extra_headers=None):
+        assert file_id == self.batch["output_file_id"]
+        return SimpleNamespace(text=self.output)
+    
+    def post(self, path, *, body, cast_to, options):
+        self.requests.append(("POST", path, body, options))
+        return httpx.Response(200, json=self.batch)
+    
+    def get(self, path, *, cast_to, options):
+        self.requests.append(("GET", path, None, options))
+        return httpx.Response(200, json=self.batch)
+
+
+def output_line(application_id, content) -> str:
+    """One line of a Batch API output file"""
+    return json.dumps({
+        "custom_id": str(application_id),
+        "response": {"body": {"choices": [{"message": {"content": content}}]}},
+    })
+
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory SQLite database"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)()
+    session.add_all([
+        Application(confluence_page_id="p1", subject="불량 예측 AI"),
+        Application(confluence_page_id="p2", subject="문서 요약"),
+    ])
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """Fake OpenAI client installed on the evaluator"""
+    fake = FakeOpenAI()
+    monkeypatch.setattr(llm_evaluator, "openai_client", fake)
+    return fake
+
+
+def test_submit_batch_request(db, client):
+    """Each application becomes one JSONL request with an output token cap and fresh message ids"""
+    applications = db.query(Application).order_by(Application.id).all()
+    assert llm_evaluator.submit_batch_evaluation(db, applications, []) == "batch_1"
+    
+    (name, content), purpose, headers = client.uploads[0]
+    assert purpose == "batch" and "Prompt-Msg-Id" in headers
+    lines = [json.loads(line) for line in content.splitlines()]
+    assert [line["custom_id"] for line in lines] == [str(application.id) for application in applications]
+    assert all(line["body"]["max_tokens"] > 0 for line in lines)
+    
+    method, path, body, options = client.requests[0]
+    assert (method, path, body["input_file_id"]) == ("POST", "/batches", "file_in")
+    assert options["headers"]["Prompt-Msg-Id"] != headers["Prompt-Msg-Id"]
+
+
+def test_collect_running_batch_returns_none(db, client):
+    """collect checks the status once and returns None while the batch runs"""
+    assert llm_evaluator.collect_batch_evaluation(db, "batch_1") is None
+    assert [request[:2] for request in client.requests] == [("GET", "/batches/batch_1")]
+    assert db.query(EvaluationHistory).count() == 0
+
+
+def test_collect_completed_batch_stores_results(db, client):
+    """Valid results are stored and committed; invalid ones are reported as failures"""
+    first, second = db.query(Application).order_by(Application.id).all()
+    client.batch = {"id": "batch_1", "status": "completed", "output_file_id": "file_out"}
+    client.output = "\n".join([
+        output_line(first.id, '{"ai_category": "예측", "technical_feasibility": "충분히 가능"}'),
+        output_line(second.id, "JSON이 아닌 응답"),
+    ])
+    
+    assert llm_evaluator.collect_batch_evaluation(db, "batch_1") == {first.id: True, second.id: False}
+    db.rollback()
+    assert (first.ai_grade, first.ai_category_primary) == ("A", "예측")
+    assert second.ai_grade is None
+    assert db.query(EvaluationHistory).count() == 1
+
+
+def test_collect_failed_batch(db, client):
+    """A batch that ended without output stores nothing"""
+    client.batch = {"id": "batch_1", "status": "expired"}
+    assert llm_evaluator.collect_batch_evaluation(db, "batch_1") == {}
+
+
+def test_cli_collect_gives_up_at_deadline(db, client, monkeypatch):
+    """collect --wait stops polling at the timeout and exits with 2"""
+    clock = [0.0]
+    monkeypatch.setattr(batch_evaluate.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(batch_evaluate.time, "sleep", lambda seconds: clock.__setitem__(0, clock[0] + seconds))
+    
+    assert batch_evaluate.collect(db, "batch_1", wait=True, timeout=300, poll_interval=60) == 2
+    assert clock[0] <= 300
+    assert len(client.requests) == 6  # 0, 60, ..., 300초에 확인
+    
+    client.batch = {"id": "batch_1", "status": "completed", "output_file_id": "file_out"}
+    client.output = output_line(db.query(Application.id).first()[0], '{"ai_category": "분류"}')
+    assert batch_evaluate.collect(db, "batch_1", wait=True, timeout=300, poll_interval=60) == 0
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Confluence Parser Test Script
+Tests saving synced pages to the database (SQLite in memory)
+"""
+import importlib
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.database import Base
+from app.models import Application, Department
+from app.services.confluence_parser import ConfluenceParser
+
+# app.services가 싱글턴을 같은 이름으로 내보내므로 모듈은 importlib로 가져옴
+confluence_module = importlib.import_module("app.services.confluence_parser")
+
+
+def page_html(subject: str, division: str = "메모리") -> str:
+    """Minimal application page with subject and division rows"""
+    return (
+        f'<table><tr><th class="subject">과제명</th></tr><tr><td>{subject}</td></tr>'
+        f'<tr><th class="division">소속</th></tr><tr><td>{division}</td></tr></table>'
+    )
+
+
+@pytest.fixture
+def db():
+    """Session on a fresh in-memory SQLite database"""
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)()
+    session.add(Department(name="메모리사업부"))
+    session.commit()
+    yield session
+    session.close()
+    engine.dispose()
+
+
+def make_parser(pages: dict) -> ConfluenceParser:
+    """Parser whose Confluence calls return the given {page_id: html}"""
+    parser = ConfluenceParser()
+    parser.iter_child_pages = lambda: iter(
+        {"id": page_id, "title": page_id, "url": f"http://conf/{page_id}", "version": None}
+        for page_id in pages
+    )
+    parser.get_page_content = pages.get
+    return parser
+
+
+def stored(db) -> dict:
+    """{confluence_page_id: (id, subject, department_id)} of stored applications"""
+    return {
+        page_id: (app_id, subject, department_id)
+        for page_id, app_id, subject, department_id in db.query(
+            Application.confluence_page_id, Application.id, Application.subject, Application.department_id
+        )
+    }
+
+
+def test_upsert_inserts_then_updates_on_conflict(db):
+    """New pages are inserted and returned with their ids; existing pages are updated in place"""
+    parser = ConfluenceParser()
+    created = parser._write_rows(db, [
+        {"confluence_page_id": "p1", "subject": "A", "division": "메모리"},
+        {"confluence_page_id": "p2", "subject": "B", "division": "없는 조직"},
+    ], [])
+    db.commit()
+    rows = stored(db)
+    # RETURNING으로 받은 id가 저장된 행의 id와 일치
+    assert created == {"p1": rows["p1"][0], "p2": rows["p2"][0]}
+    assert rows["p1"][2] is not None and rows["p2"][2] is None
+    
+    created = parser._write_rows(db, [], [{"id": created["p1"], "confluence_page_id": "p1", "subject": "A2"}])
+    db.commit()
+    assert created == {}
+    assert stored(db)["p1"][:2] == (rows["p1"][0], "A2")
+    assert db.query(Application).count() == 2
+
+
+def test_upsert_duplicate_insert_updates_existing_row(db):
+    """A page inserted again (e.g. by a concurrent sync) hits ON CONFLICT DO UPDATE"""
+    parser = ConfluenceParser()
+    first = parser._write_rows(db, [{"confluence_page_id": "p1", "subject": "A"}], [])
+    second = parser._write_rows(db, [{"confluence_page_id": "p1", "subject": "B"}], [])
+    db.commit()
+    assert first == second
+    assert stored(db)["p1"][:2] == (first["p1"], "B")
+
+
+def test_write_rows_without_upsert_support(db, monkeypatch):
+    """Backends without ON CONFLICT use plain INSERT/UPDATE and re-select the new ids"""
+    monkeypatch.setattr(confluence_module, "_UPSERT_INSERTS", {})
+    statements = []
+    event.listen(db.get_bind(), "before_cursor_execute", lambda *args: statements.append(args[2]))
+    parser = ConfluenceParser()
+    created = parser._write_rows(db, [
+        {"confluence_page_id": "p1", "subject": "A", "division": "메모리"},
+        {"confluence_page_id": "p2", "subject": "B"},
+    ], [])
+    db.commit()
+    rows = stored(db)
+    assert created == {"p1": rows["p1"][0], "p2": rows["p2"][0]}
+    assert rows["p1"][2] is not None
+    assert not any("RETURNING" in statement for statement in statements)
+    
+    parser._write_rows(db, [], [{"id": created["p2"], "confluence_page_id": "p2", "subject": "B2"}])
+    db.commit()
+    assert stored(db)["p2"][1] == "B2"
+
+
+def test_sync_skips_unchanged_content_hash(db):
+    """Pages whose content hash did not change are not written again"""
+    pages = {"p1": page_html("A"), "p2": page_html("B")}
+    result = make_parser(pages).sync_applications(db, batch_id="2026-1Q")
+    assert (result["new_count"], result["updated_count"], result["unchanged_count"]) == (2, 0, 0)
+    ids = {page_id: row[0] for page_id, row in stored(db).items()}
+    
+    pages["p2"] = page_html("B 수정")
+    result = make_parser(pages).sync_applications(db, batch_id="2026-1Q", force_update=True)
+    assert (result["new_count"], result["updated_count"], result["unchanged_count"]) == (0, 1, 1)
+    rows = stored(db)
+    assert {page_id: row[0] for page_id, row in rows.items()} == ids
+    assert rows["p2"][1] == "B 수정"
+    
+    # 본문이 같아도 회차가 바뀌면 batch_id 갱신을 위해 저장
+    result = make_parser(pages).sync_applications(db, batch_id="2026-2Q", force_update=True)
+    assert (result["updated_count"], result["unchanged_count"]) == (2, 0)
+    assert {batch_id for (batch_id,) in db.query(Application.batch_id)} == {"2026-2Q"}
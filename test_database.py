@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Database Test Script
+Tests adding columns that an existing database is missing
+"""
+from sqlalchemy import create_engine, inspect, text
+from app.database import Base, add_missing_columns
+import app.models  # noqa: F401  (모든 테이블을 Base.metadata에 등록)
+
+
+def test_add_missing_columns_to_existing_table(tmp_path):
+    """Columns added to a model after the table was created are added on startup"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    with engine.begin() as conn:
+        conn.execute(text(
+            "CREATE TABLE applications (id INTEGER PRIMARY KEY, confluence_page_id VARCHAR(50) NOT NULL)"
+        ))
+        conn.execute(text("INSERT INTO applications (id, confluence_page_id) VALUES (1, 'p1')"))
+    
+    assert add_missing_columns(engine) == ["applications.content_hash"]
+    columns = {column["name"] for column in inspect(engine).get_columns("applications")}
+    assert "content_hash" in columns
+    with engine.connect() as conn:
+        assert conn.execute(text("SELECT confluence_page_id, content_hash FROM applications")).all() == [("p1", None)]
+    
+    # 이미 있으면 아무것도 하지 않음
+    assert add_missing_columns(engine) == []
+    engine.dispose()
+
+
+def test_add_missing_columns_on_new_database(tmp_path):
+    """A database created from the current models needs no changes"""
+    engine = create_engine(f"sqlite:///{tmp_path / 'new.db'}")
+    Base.metadata.create_all(engine)
+    assert add_missing_columns(engine) == []
+    engine.dispose()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+Grading Test Script
+Tests conversion between numeric scores and letter grades
+"""
+import pytest
+from app.services.grading import GRADE_SCORES, score_to_grade
+
+
+@pytest.mark.parametrize("score, grade", [
+    (1.0, "D"),
+    (1.49, "D"),
+    (1.5, "C"),
+    (2.49, "C"),
+    (2.5, "B"),
+    (3.49, "B"),
+    (3.5, "A"),
+    (4.49, "A"),
+    (4.5, "S"),
+    (5.0, "S"),
+])
+def test_score_to_grade_boundaries(score, grade):
+    """Thresholds are inclusive: a score equal to a boundary gets the higher grade"""
+    assert score_to_grade(score) == grade
+
+
+def test_grade_scores_round_trip():
+    """Every grade's own score converts back to the same grade"""
+    for grade, score in GRADE_SCORES.items():
+        assert score_to_grade(score) == grade
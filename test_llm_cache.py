@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+LLM Cache Test Script
+Tests the LLMResponseCache class and application result cache keys
+"""
+import os
+import time
+import importlib
+import unicodedata
+import pytest
+from app.config import settings
+from app.models.application import Application
+from app.models.evaluation import EvaluationCriteria
+from app.services.llm_cache import LLMResponseCache
+from app.services.llm_evaluator import llm_evaluator, _canonical_text
+
+# app.services가 싱글턴을 같은 이름으로 내보내므로 모듈은 importlib로 가져옴
+llm_cache_module = importlib.import_module("app.services.llm_cache")
+
+
+def test_make_key():
+    """Model, temperature and prompt all change the key"""
+    key = LLMResponseCache.make_key("gpt-oss", 0.1, "프롬프트")
+    assert key == LLMResponseCache.make_key("gpt-oss", 0.1, "프롬프트")
+    assert key != LLMResponseCache.make_key("gpt-oss", 0.2, "프롬프트")
+    assert key != LLMResponseCache.make_key("other", 0.1, "프롬프트")
+    assert key != LLMResponseCache.make_key("gpt-oss", 0.1, "다른 프롬프트")
+
+
+def test_get_and_set(tmp_path):
+    """A missing key is None; a stored response is read back"""
+    cache = LLMResponseCache(str(tmp_path), memory_size=0)
+    assert cache.get("abc") is None
+    cache.set("abc", "응답")
+    assert cache.get("abc") == "응답"
+    assert cache._path("abc").parent.name == "ab"
+
+
+def test_disk_entry_expires_by_mtime(tmp_path):
+    """Disk entries older than the TTL (by file mtime) are misses"""
+    cache = LLMResponseCache(str(tmp_path), memory_size=0, ttl=60)
+    cache.set("abc", "응답")
+    path = cache._path("abc")
+    
+    os.utime(path, (time.time() - 30, time.time() - 30))
+    assert cache.get("abc") == "응답"
+    
+    os.utime(path, (time.time() - 61, time.time() - 61))
+    assert cache.get("abc") is None
+
+
+def test_memory_entry_expires(tmp_path, monkeypatch):
+    """Memory entries expire with the same TTL as the disk copy"""
+    cache = LLMResponseCache(str(tmp_path), memory_size=4, ttl=60)
+    cache.set("abc", "응답")
+    os.utime(cache._path("abc"), (time.time() - 120, time.time() - 120))
+    assert cache.get("abc") == "응답"
+    
+    now = time.time()
+    monkeypatch.setattr(llm_cache_module.time, "time", lambda: now + 61)
+    assert cache.get("abc") is None
+
+
+def test_no_ttl_never_expires(tmp_path):
+    """ttl=0 keeps entries regardless of age"""
+    cache = LLMResponseCache(str(tmp_path), memory_size=0, ttl=0)
+    cache.set("abc", "응답")
+    os.utime(cache._path("abc"), (0, 0))
+    assert cache.get("abc") == "응답"
+
+
+def test_memory_lru_eviction(tmp_path):
+    """The least recently used entry leaves memory first but stays on disk"""
+    cache = LLMResponseCache(str(tmp_path), memory_size=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert list(cache._memory) == ["a", "c"]
+    
+    assert cache.get("b") == "2"
+    assert list(cache._memory) == ["c", "b"]
+
+
+def test_set_replaces_file_atomically(tmp_path, monkeypatch):
+    """set writes a temp file and moves it into place with os.replace"""
+    cache = LLMResponseCache(str(tmp_path), memory_size=0)
+    replaced = []
+    real_replace = os.replace
+    
+    def replace(src, dst):
+        replaced.append((src, dst))
+        real_replace(src, dst)
+    
+    monkeypatch.setattr(llm_cache_module.os, "replace", replace)
+    cache.set("abc", "첫 응답")
+    cache.set("abc", "둘째 응답")
+    
+    path = cache._path("abc")
+    assert [dst for _, dst in replaced] == [path, path]
+    assert all(src.endswith(".tmp") and os.path.dirname(src) == str(path.parent) for src, _ in replaced)
+    assert path.read_text(encoding="utf-8") == "둘째 응답"
+    assert os.listdir(path.parent) == [path.name]
+
+
+def test_failed_write_keeps_previous_file(tmp_path, monkeypatch):
+    """A failed replace leaves the old entry intact and removes the temp file"""
+    cache = LLMResponseCache(str(tmp_path), memory_size=0)
+    cache.set("abc", "첫 응답")
+    
+    def replace(src, dst):
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(llm_cache_module.os, "replace", replace)
+    cache.set("abc", "둘째 응답")
+    
+    path = cache._path("abc")
+    assert path.read_text(encoding="utf-8") == "첫 응답"
+    assert os.listdir(path.parent) == [path.name]
+
+
+def test_stats(tmp_path):
+    """stats counts memory and disk hits, misses, and memory entries"""
+    cache = LLMResponseCache(str(tmp_path), memory_size=1)
+    assert cache.get("a") is None
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("b") == "2"
+    assert cache.get("a") == "1"
+    assert cache.stats() == {"hits": 2, "misses": 1, "memory_entries": 1}
+
+
+def make_criteria(**fields) -> list:
+    """Transient active criteria list"""
+    values = {"id": 1, "name": "기술 타당성", "description": "구현 가능성", "weight": 1.0, "display_order": 1}
+    values.update(fields)
+    return [EvaluationCriteria(**values)]
+
+
+def make_application(**fields) -> Application:
+    """Transient application with the given prompt fields"""
+    values = {
+        "subject": "불량 예측 AI",
+        "participant_count": 5,
+        "representative_name": "홍길동",
+        "current_work": "수작업 검사",
+        "pain_point": "시간 소요",
+        "improvement_idea": "ML 분류",
+        "expected_effect": "50% 단축",
+        "hope": "멘토링",
+        "pre_survey": {"q1": "예"},
+        "tech_capabilities": [{"category": "프로그래밍", "skill": "Python", "level": 3}],
+    }
+    values.update(fields)
+    return Application(**values)
+
+
+def test_canonical_text():
+    """NFKC and whitespace differences collapse; other values pass through"""
+    assert _canonical_text("  불량\u3000예측\n\nＡＩ\t") == "불량 예측 AI"
+    assert _canonical_text(5) == 5
+
+
+@pytest.mark.parametrize("fields", [
+    {"subject": "불량 예측 ＡＩ"},
+    {"subject": " 불량  예측\tAI\n"},
+    {"current_work": "수작업\u00a0검사", "hope": "멘토링\r\n"},
+    {"pain_point": unicodedata.normalize("NFD", "시간 소요")},
+])
+def test_application_cache_key_ignores_formatting(fields, monkeypatch):
+    """Resubmissions that differ only in width/composition/whitespace share a key"""
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    base_key = llm_evaluator._application_cache_key(make_application(), make_criteria())
+    assert base_key is not None
+    assert llm_evaluator._application_cache_key(make_application(**fields), make_criteria()) == base_key
+
+
+def test_application_cache_key_changes_with_content(monkeypatch):
+    """A different word gives a different key; caching off gives no key"""
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    assert llm_evaluator._application_cache_key(make_application(), make_criteria()) != \
+        llm_evaluator._application_cache_key(make_application(pain_point="비용 소요"), make_criteria())
+    
+    monkeypatch.setattr(settings, "llm_cache_enabled", False)
+    assert llm_evaluator._application_cache_key(make_application(), make_criteria()) is None
+
+
+def test_application_cache_key_changes_with_criteria(monkeypatch):
+    """Editing the active criteria gives a new key, so stale grades are not reused"""
+    monkeypatch.setattr(settings, "llm_cache_enabled", True)
+    application = make_application()
+    base_key = llm_evaluator._application_cache_key(application, make_criteria())
+    assert llm_evaluator._application_cache_key(application, make_criteria()) == base_key
+    assert llm_evaluator._application_cache_key(application, make_criteria(weight=2.0)) != base_key
+    assert llm_evaluator._application_cache_key(application, make_criteria(evaluation_guide="새 기준")) != base_key
+    assert llm_evaluator._application_cache_key(application, []) != base_key
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+LLM Evaluator Test Script
+Tests JSON extraction from LLM responses
+"""
+import json
+import pytest
+from app.services.llm_evaluator import _extract_json_from_text, _JsonObjectScanner
+
+
+def test_extract_direct_json():
+    """Whole response is a JSON object"""
+    assert _extract_json_from_text('  {"ai_category": "예측", "score": 4}\n') == {"ai_category": "예측", "score": 4}
+
+
+def test_extract_fenced_json_with_surrounding_text():
+    """JSON inside a ```json fence with explanation before and after"""
+    text = '평가 결과입니다.\n```json\n{"ai_category": "분류", "five_line_summary": ["1", "2"]}\n```\n참고하세요.'
+    assert _extract_json_from_text(text) == {"ai_category": "분류", "five_line_summary": ["1", "2"]}
+
+
+def test_extract_json_after_prose_without_fence():
+    """Object found by brace scanning when the response has no fence"""
+    assert _extract_json_from_text('결과: {"a": {"b": 1}} 끝') == {"a": {"b": 1}}
+
+
+def test_extract_nested_braces_inside_strings():
+    """Braces and escaped quotes inside strings do not end the object"""
+    text = '설명 {"business_impact": "효과 {x} } \\" 끝", "nested": {"k": "}"}} 이후'
+    assert _extract_json_from_text(text) == {"business_impact": '효과 {x} } " 끝', "nested": {"k": "}"}}
+
+
+def test_extract_trailing_commas():
+    """Trailing commas before closing brackets are removed"""
+    text = '```json\n{"five_line_summary": ["1", "2",], "ai_category": "챗봇",}\n```'
+    assert _extract_json_from_text(text) == {"five_line_summary": ["1", "2"], "ai_category": "챗봇"}
+
+
+def test_extract_control_characters_in_strings():
+    """Raw newlines inside strings are accepted"""
+    assert _extract_json_from_text('{"business_impact": "첫 줄\n둘째 줄"}') == {"business_impact": "첫 줄\n둘째 줄"}
+
+
+@pytest.mark.parametrize("text", ["", "JSON 없이 설명만 있는 응답", "[1, 2, 3]", '{"a": 1'])
+def test_extract_no_json_object(text):
+    """No JSON object raises JSONDecodeError"""
+    with pytest.raises(json.JSONDecodeError):
+        _extract_json_from_text(text)
+
+
+def test_scanner_across_chunks():
+    """Objects split across stream chunks are reported when complete"""
+    scanner = _JsonObjectScanner()
+    assert scanner.feed('앞 {"a": "{') == []
+    assert scanner.feed('}", "b": [1,') == []
+    assert scanner.feed(' 2]} 뒤 {"c": 3}') == ['{"a": "{}", "b": [1, 2]}', '{"c": 3}']
+    assert scanner.text == '앞 {"a": "{}", "b": [1, 2]} 뒤 {"c": 3}'
+
+
+def test_scanner_escape_split_across_chunks():
+    """Escaped quote at a chunk boundary stays inside the string"""
+    scanner = _JsonObjectScanner()
+    assert scanner.feed('{"a": "x\\') == []
+    assert scanner.feed('"}"}') == ['{"a": "x\\"}"}']
+
+
+def test_scanner_ignores_quotes_outside_objects():
+    """Quotes in prose before the object do not start a string"""
+    assert _JsonObjectScanner().feed('"인용" 문장 {"a": 1}') == ['{"a": 1}']
@@ -1,11 +1,13 @@
 #!/usr/bin/env python3
 """
 Rate Limiter Test Script
-Tests the RateLimiter class to ensure it properly limits API calls
+Tests the RateLimiter and TokenBucketLimiter classes to ensure they properly limit API calls
 """
 import time
+import asyncio
+import threading
 from datetime import datetime
-from app.services.rate_limiter import RateLimiter
+from app.services.rate_limiter import RateLimiter, TokenBucketLimiter
 
 
 def test_rate_limiter():
@@ -80,6 +82,140 @@ def test_production_rate_limiter():
     print(f"{'=' * 60}")
 
 
+def test_penalize_while_another_caller_waits():
+    """A waiting caller does not hold the lock, so penalize() returns at once and is honored"""
+    limiter = RateLimiter(max_calls=1, time_window=1)
+    limiter.wait_if_needed()
+    waiter = threading.Thread(target=limiter.wait_if_needed)
+    start = time.monotonic()
+    waiter.start()
+    time.sleep(0.2)
+    
+    limiter.penalize(2)
+    assert time.monotonic() - start < 0.5
+    
+    waiter.join()
+    # 창이 비어도 penalize로 요청된 대기가 끝날 때까지 기다림
+    assert time.monotonic() - start >= 2
+    assert limiter.get_remaining_calls() == 0
+    
+    limiter.reset()
+    assert limiter.get_wait_time() == 0
+
+
+def test_token_bucket_refill():
+    """Both buckets refill with elapsed time, capped at the per-minute budget"""
+    limiter = TokenBucketLimiter(requests_per_minute=600, tokens_per_minute=6000)
+    limiter.available_requests = 0.0
+    limiter.available_tokens = 0.0
+    limiter.last_update = time.monotonic() - 1
+    
+    limiter._refill()
+    assert 10 <= limiter.available_requests < 11
+    assert 100 <= limiter.available_tokens < 110
+    
+    limiter.last_update = time.monotonic() - 120
+    limiter._refill()
+    assert limiter.available_requests == 600
+    assert limiter.available_tokens == 6000
+
+
+def test_token_bucket_blocks_when_requests_exhausted():
+    """A call waits for the request bucket once the RPM budget is used up"""
+    limiter = TokenBucketLimiter(requests_per_minute=600, tokens_per_minute=60000)
+    for _ in range(600):
+        assert limiter._try_take(0) == 0
+    assert limiter._try_take(0) > 0
+    
+    start = time.monotonic()
+    limiter.wait()
+    assert time.monotonic() - start >= 0.05
+
+
+def test_token_bucket_blocks_when_tokens_exhausted():
+    """A call waits until enough tokens refill for its estimated cost"""
+    limiter = TokenBucketLimiter(requests_per_minute=600, tokens_per_minute=6000)
+    limiter.wait(6000)
+    
+    start = time.monotonic()
+    asyncio.run(limiter.acquire(50))
+    # 50 tokens at 100 tokens/s
+    assert time.monotonic() - start >= 0.4
+
+
+def test_token_bucket_caps_oversized_requests():
+    """A call larger than the bucket waits for a full bucket instead of forever"""
+    limiter = TokenBucketLimiter(requests_per_minute=600, tokens_per_minute=6000)
+    limiter.wait(10 ** 9)
+    assert limiter.available_tokens < 1
+
+
+def test_token_bucket_penalize():
+    """penalize(ratio) drains that fraction of both budgets, even below zero"""
+    limiter = TokenBucketLimiter(requests_per_minute=600, tokens_per_minute=6000)
+    limiter.penalize(0.5)
+    assert 300 <= limiter.available_requests < 301
+    assert 3000 <= limiter.available_tokens < 3010
+    
+    limiter.available_requests = 0.0
+    limiter.penalize(0.1)
+    assert limiter.available_requests < -59
+    # 부족분 60건 + 1건이 채워질 때까지 대기 (600건/분 = 10건/초)
+    assert limiter._try_take(0) >= 6
+    
+    # 반복된 429에도 부족분은 1분 예산까지만 쌓임
+    for _ in range(50):
+        limiter.penalize(0.5)
+    assert limiter.available_requests == -600
+    assert limiter.available_tokens == -6000
+    assert limiter._try_take(0) <= 61
+
+
+def test_token_bucket_across_event_loops():
+    """The async lock is per event loop, so the limiter survives repeated asyncio.run"""
+    limiter = TokenBucketLimiter(requests_per_minute=6000, tokens_per_minute=600000)
+    
+    async def contend():
+        limiter.available_requests = 0.0
+        # 두 번째 호출은 첫 번째가 잠금을 가진 동안 대기 (잠금이 현재 루프에 묶임)
+        await asyncio.gather(limiter.acquire(), limiter.acquire())
+    
+    asyncio.run(contend())
+    asyncio.run(contend())
+
+
+def test_token_bucket_mixed_sync_and_async_callers():
+    """Threads using wait() and coroutines using acquire() share one budget"""
+    limiter = TokenBucketLimiter(requests_per_minute=600, tokens_per_minute=60000)
+    limiter.available_requests = 0.0
+    calls = []
+    
+    def sync_caller():
+        for _ in range(3):
+            limiter.wait(10)
+            calls.append("sync")
+    
+    async def async_caller():
+        for _ in range(3):
+            await limiter.acquire(10)
+            calls.append("async")
+    
+    async def run():
+        thread = threading.Thread(target=sync_caller)
+        thread.start()
+        await asyncio.gather(async_caller(), async_caller())
+        await asyncio.to_thread(thread.join)
+    
+    start = time.monotonic()
+    asyncio.run(run())
+    elapsed = time.monotonic() - start
+    
+    assert sorted(calls) == ["async"] * 6 + ["sync"] * 3
+    # 빈 버킷에서 9건 = 0.9초 분량 (두 호출자가 같은 용량을 중복 사용하지 않음)
+    assert elapsed >= 0.8
+    assert limiter.available_requests < 1
+
+
 if __name__ == "__main__":
     # Run quick test
     test_rate_limiter()